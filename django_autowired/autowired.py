@@ -1,11 +1,13 @@
-import functools
 import json
+from typing import AbstractSet
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Set
+from typing import Tuple
 from typing import Type
 
 from django.http.request import HttpRequest
@@ -19,7 +21,6 @@ from django_autowired.openapi.docs import get_swagger_ui_html
 from django_autowired.openapi.utils import OpenAPISchemaGenerator
 from django_autowired.route import ViewRoute
 from django_autowired.typing import BodyType
-from django_autowired.utils import BodyConverter
 from pydantic import BaseModel
 from pydantic import ValidationError
 from pydantic.error_wrappers import ErrorWrapper
@@ -28,6 +29,22 @@ from pydantic.fields import ModelField
 ViewFunc = Callable
 
 
+def _prepare_list(content: List) -> Tuple[List, Iterable[Tuple[int, Any]]]:
+    return [None] * len(content), enumerate(content)
+
+
+def _prepare_dict(content: Dict) -> Tuple[Dict, Iterable[Tuple[Any, Any]]]:
+    # fromkeys keeps the key order of the original dict
+    return dict.fromkeys(content), content.items()
+
+
+# exact type -> (empty container, children) builder
+_PREPARE_DISPATCH: Dict[type, Callable[[Any], Tuple[Any, Iterable]]] = {
+    list: _prepare_list,
+    dict: _prepare_dict,
+}
+
+
 def _prepare_response_content(
     content: Any,
     *,
@@ -35,50 +52,59 @@ def _prepare_response_content(
     exclude_defaults: bool = False,
     exclude_none: bool = False,
 ) -> Any:
-    if isinstance(content, BaseModel):
-        return content.dict(
-            by_alias=True,
-            exclude_unset=exclude_unset,
-            exclude_defaults=exclude_defaults,
-            exclude_none=exclude_none,
-        )
-    elif isinstance(content, list):
-        return [
-            _prepare_response_content(
-                item,
-                exclude_unset=exclude_unset,
-                exclude_defaults=exclude_defaults,
-                exclude_none=exclude_none,
-            )
-            for item in content
-        ]
-    elif isinstance(content, dict):
-        return {
-            k: _prepare_response_content(
-                v,
-                exclude_unset=exclude_unset,
-                exclude_defaults=exclude_defaults,
-                exclude_none=exclude_none,
-            )
-            for k, v in content.items()
-        }
-    return content
+    """
+    Dump every BaseModel found in (nested) lists and dicts of `content`.
+
+    The structure is walked with an explicit stack instead of recursion, each
+    pending item is a (container, key, value) triple to fill in.
+    """
+    root: List[Any] = [content]
+    stack: List[Tuple[Any, Any, Any]] = [(root, 0, content)]
+    while stack:
+        container, key, item = stack.pop()
+        handler = _PREPARE_DISPATCH.get(type(item))
+        if handler is None:
+            if isinstance(item, BaseModel):
+                container[key] = item.dict(
+                    by_alias=True,
+                    exclude_unset=exclude_unset,
+                    exclude_defaults=exclude_defaults,
+                    exclude_none=exclude_none,
+                )
+                continue
+            elif isinstance(item, list):
+                handler = _prepare_list
+            elif isinstance(item, dict):
+                handler = _prepare_dict
+            else:
+                container[key] = item
+                continue
 
+        prepared, children = handler(item)
+        container[key] = prepared
+        for child_key, child in children:
+            stack.append((prepared, child_key, child))
 
-def serialize_response(
+    return root[0]
+
+
+def get_response_serializer(
     *,
-    response_content: Any,
-    field: Optional[ModelField] = None,
-    include: Optional[Set[str]] = None,
-    exclude: Optional[Set[str]] = None,
+    field: ModelField,
+    include: Optional[AbstractSet[str]] = None,
+    exclude: Optional[AbstractSet[str]] = None,
     by_alias: bool = True,
-) -> Any:
-    if field:
+) -> Callable[[Any], Any]:
+    """Bind the response field and dump options once, per view"""
+    validate = field.validate
+    loc = ("response",)
+
+    def serializer(response_content: Any) -> Any:
         errors = []
         response_content = _prepare_response_content(
             content=response_content,
         )
-        value, errors_ = field.validate(response_content, {}, loc=("response",))
+        value, errors_ = validate(response_content, {}, loc=loc)
 
         if isinstance(errors_, ErrorWrapper):
             errors.append(errors_)
@@ -94,13 +120,38 @@ def serialize_response(
 
         return result
 
+    return serializer
+
+
+def serialize_response(
+    *,
+    response_content: Any,
+    field: Optional[ModelField] = None,
+    include: Optional[Set[str]] = None,
+    exclude: Optional[Set[str]] = None,
+    by_alias: bool = True,
+) -> Any:
+    """
+    One-off validation and dump of a response against its response field.
+
+    Views no longer go through it, each binds its own serializer once with
+    get_response_serializer. It is kept as public API for external callers.
+    """
+    if field:
+        serializer = get_response_serializer(
+            field=field, include=include, exclude=exclude, by_alias=by_alias
+        )
+        return serializer(response_content)
+
     else:
         return response_content
 
 
 class Autowired(object):
     def __init__(self) -> None:
-        # TODO
+        # Only read when building the schema; requests use the route bound into
+        # each wrapper. Every decorated view stays registered for the life of
+        # the process, its route references the view function anyway.
         self._view_route: Dict[ViewFunc, ViewRoute] = {}
 
     def setup_schema(
@@ -203,67 +254,99 @@ class Autowired(object):
                 name=name,
             )
             self._view_route[func] = route
-            body_field = route.body_field
+            # Resolve everything the view needs once, at decoration time, so a
+            # request never has to go back through ``self._view_route``.
+            dependant = route.dependant
+            ismethod = dependant.ismethod
             is_body_form = route.is_body_form
-
-            def inner(*args, **kwargs) -> Any:
-                """
-                When called, the method will identify and inject the dependency
-                """
-                dependant = self._view_route[func].dependant
-                view_func = func
-                if dependant.ismethod:
-                    # class-base view
-                    view_self = args[0]
-                    view_func = functools.partial(func, view_self)
-                    view_request: HttpRequest = args[1]
-                    # view_args = args[2:]
-                else:
-                    # function view
-                    view_request = args[0]
-                    # view_args = args[1:]
-                # slove dependency
-                try:
-                    body: Optional[BodyType] = None
-
-                    if body_field:
-                        if is_body_form:
-                            body = BodyConverter.to_form(request=view_request)
-                        else:
-                            body = BodyConverter.to_json(request=view_request)
-                except json.JSONDecodeError as e:
-                    raise RequestValidationError(
-                        [ErrorWrapper(exc=e, loc=("body", e.pos))], body=e.doc
-                    )
-                except Exception:
-                    raise APIException(detail="parse body error", status_code=422)
-
-                solved_result = dependant.solve_dependencies(
-                    request=view_request,
-                    body=body,
-                    path_kwargs=kwargs,
-                    is_body_form=is_body_form,
+            response_field = route.response_field
+            parse_body = route.body_parser
+            serializer = None
+            if response_field is not None:
+                serializer = get_response_serializer(
+                    field=response_field,
+                    include=route.response_model_include,
+                    exclude=route.response_model_exclude,
+                    by_alias=route.response_model_by_alias,
                 )
-                values, errors = solved_result
-                if errors:
-                    # design after
-                    raise RequestValidationError(errors=errors, body=body)
-
-                raw_response = view_func(**values)
-
-                if isinstance(raw_response, HttpResponse):
-                    return raw_response
-                else:
-                    response_data = serialize_response(
-                        response_content=raw_response,
-                        field=route.response_field,
-                        include=response_model_include,
-                        exclude=response_model_exclude,
-                        by_alias=response_model_by_alias,
-                    )
-                    response = response_class(response_data, status=status_code)
-                    return response
 
+            if serializer is None and dependant.is_paramless():
+                # Nothing to parse, resolve or validate: at most the request
+                # itself is injected, so skip straight to the view.
+                request_param_name = dependant.request_param_name
+
+                def dispatch(
+                    view_request: HttpRequest, path_kwargs: Dict, *bound
+                ) -> Any:
+                    if request_param_name is None:
+                        raw_response = func(*bound)
+                    else:
+                        raw_response = func(
+                            *bound, **{request_param_name: view_request}
+                        )
+
+                    if isinstance(raw_response, HttpResponse):
+                        return raw_response
+                    return response_class(raw_response, status=status_code)
+
+            else:
+                positional_args = dependant.positional_args
+
+                def dispatch(
+                    view_request: HttpRequest, path_kwargs: Dict, *bound
+                ) -> Any:
+                    """
+                    When called, the method will identify and inject the dependency
+                    """
+                    # slove dependency
+                    try:
+                        body: Optional[BodyType] = None
+
+                        if parse_body is not None:
+                            body = parse_body(view_request)
+                    except json.JSONDecodeError as e:
+                        raise RequestValidationError(
+                            [ErrorWrapper(exc=e, loc=("body", e.pos))], body=e.doc
+                        )
+                    except Exception:
+                        raise APIException(detail="parse body error", status_code=422)
+
+                    solved_result = dependant.solve_dependencies(
+                        request=view_request,
+                        body=body,
+                        path_kwargs=path_kwargs,
+                        is_body_form=is_body_form,
+                    )
+                    values, errors = solved_result
+                    if errors:
+                        # design after
+                        raise RequestValidationError(errors=errors, body=body)
+
+                    if positional_args is None:
+                        raw_response = func(*bound, **values)
+                    else:
+                        raw_response = func(*bound, *positional_args(values))
+
+                    if isinstance(raw_response, HttpResponse):
+                        return raw_response
+                    elif serializer is None:
+                        return response_class(raw_response, status=status_code)
+                    else:
+                        response_data = serializer(raw_response)
+                        response = response_class(response_data, status=status_code)
+                        return response
+
+            # ismethod is fixed per view, so pick the calling convention here
+            # rather than branching (and binding ``self``) on every request.
+            def method_inner(view_self, view_request, *args, **kwargs) -> Any:
+                # class-base view
+                return dispatch(view_request, kwargs, view_self)
+
+            def func_inner(view_request, *args, **kwargs) -> Any:
+                # function view
+                return dispatch(view_request, kwargs)
+
+            inner: ViewFunc = method_inner if ismethod else func_inner
             return inner
 
         return decorator
@@ -1,23 +1,95 @@
+from copy import copy
 import inspect
+from itertools import islice
+from operator import itemgetter
 from typing import Any
 from typing import Callable
 from typing import cast
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Type
 
 from django.http.request import HttpRequest
 from django_autowired import params
 from django_autowired.dependency.utils import DependantUtils
+from django_autowired.dependency.utils import ParamTable
 from django_autowired.dependency.utils import RequestConverter
 from django_autowired.typing import BodyType
 from pydantic import create_model
 from pydantic.error_wrappers import ErrorWrapper
 from pydantic.fields import ModelField
+from pydantic.fields import SHAPE_SINGLETON
+
+
+# callable -> {is_view_func: Dependant}, copied on every use. A strong cache:
+# the cached Dependant references its callable, so entries live as long as
+# the process, like the views and dependencies they are analysed for.
+_DEPENDANT_CACHE: Dict[Callable, Dict[bool, "Dependant"]] = {}
+
+
+# where _add_scalar_field puts a param, by its location
+_SCALAR_PARAMS_ATTRS: Dict[Optional[params.ParamTypes], str] = {
+    params.ParamTypes.path: "path_params",
+    params.ParamTypes.query: "query_params",
+    params.ParamTypes.header: "header_params",
+    params.ParamTypes.cookie: "cookie_params",
+}
+
+
+# add_param_field skips the full scalar check for these param / type pairs
+_SCALAR_FAST_PARAM_TYPES = frozenset(
+    (params.Path, params.Query, params.Header, params.Cookie)
+)
+_SCALAR_FAST_TYPES = frozenset((str, int, float, bool, bytes))
+
+_ValuesGetter = Callable[[HttpRequest, Dict[str, Any]], Any]
+
+
+def _get_path_values(request: HttpRequest, path_kwargs: Dict[str, Any]) -> Any:
+    return path_kwargs
+
+
+def _get_query_values(request: HttpRequest, path_kwargs: Dict[str, Any]) -> Any:
+    return request.GET
+
+
+def _get_header_values(request: HttpRequest, path_kwargs: Dict[str, Any]) -> Any:
+    return request.headers
+
+
+def _get_cookie_values(request: HttpRequest, path_kwargs: Dict[str, Any]) -> Any:
+    return request.COOKIES
 
 
 class Dependant(object):
+    __slots__ = (
+        "call",
+        "ismethod",
+        "is_view_func",
+        "name",
+        "parent_dependant",
+        "path_params",
+        "query_params",
+        "header_params",
+        "cookie_params",
+        "body_params",
+        "dependencies",
+        "request_param_name",
+        "_flat",
+        "_body_fields",
+        # set by freeze()
+        "path_table",
+        "query_table",
+        "header_table",
+        "cookie_table",
+        "body_table",
+        "body_alias_omitted",
+        "positional_args",
+        "param_bindings",
+    )
+
     def __init__(
         self,
         *,
@@ -46,11 +118,109 @@ class Dependant(object):
         self.dependencies: List[Dependant] = []
 
         self.request_param_name: Optional[str] = None
+        # set by freeze(), once no more params or dependencies get added
+        self._flat: Optional[Dependant] = None
+        self._body_fields: Dict[str, Optional[ModelField]] = {}
+
+    def freeze(self) -> None:
+        """
+        Precompute the per-request lookup tables, call it once all params and
+        sub-dependencies have been added
+        """
+        for sub_dependant in self.dependencies:
+            sub_dependant.freeze()
+
+        self._flat = None
+        self._flat = self.flat()
+        self.path_table = RequestConverter.to_table(self.path_params)
+        self.query_table = RequestConverter.to_table(self.query_params)
+        self.header_table = RequestConverter.to_table(self.header_params)
+        self.cookie_table = RequestConverter.to_table(self.cookie_params)
+        self.body_table = RequestConverter.to_body_table(self.body_params)
+        self.body_alias_omitted = RequestConverter.is_body_alias_omitted(
+            self.body_params
+        )
+        self.positional_args = self._get_positional_args()
+        # only the locations this dependant reads, in resolution order
+        self.param_bindings: Tuple[Tuple[ParamTable, _ValuesGetter], ...] = tuple(
+            (table, get_values)
+            for table, get_values in (
+                (self.path_table, _get_path_values),
+                (self.query_table, _get_query_values),
+                (self.header_table, _get_header_values),
+                (self.cookie_table, _get_cookie_values),
+            )
+            if table.rows
+        )
+
+    def _get_positional_args(self) -> Optional[Callable[[Dict[str, Any]], Tuple]]:
+        """
+        When every argument of `call` is resolved by name and can be passed
+        positionally, return a getter turning the solved values into an args
+        tuple in signature order, a positional call is cheaper than **values
+        """
+        if self.call is None:
+            return None
+
+        names: List[str] = []
+        signature = DependantUtils.get_typed_signature(call=self.call)
+        for param in signature.parameters.values():
+            if param.name == "self":
+                continue
+            if param.kind is not inspect.Parameter.POSITIONAL_OR_KEYWORD:
+                return None
+            names.append(param.name)
+
+        resolved = {
+            field.name
+            for field in self.path_params
+            + self.query_params
+            + self.header_params
+            + self.cookie_params
+            + self.body_params
+        }
+        resolved.update(
+            sub_dependant.name
+            for sub_dependant in self.dependencies
+            if sub_dependant.name is not None
+        )
+        if self.request_param_name:
+            resolved.add(self.request_param_name)
+
+        # itemgetter returns a bare value, not a tuple, for a single name
+        if len(names) < 2 or set(names) != resolved:
+            return None
+        return itemgetter(*names)
+
+    def is_paramless(self) -> bool:
+        """No params or sub-dependencies to resolve, only the request may be injected"""
+        return not (
+            self.dependencies
+            or self.path_params
+            or self.query_params
+            or self.header_params
+            or self.cookie_params
+            or self.body_params
+        )
+
+    def has_body_params(self) -> bool:
+        """Whether this dependant or any sub-dependency reads the body"""
+        return bool(self.body_params) or any(
+            sub_dependant.has_body_params() for sub_dependant in self.dependencies
+        )
 
     def add_param_field(
         self, param: inspect.Parameter, param_field: ModelField
     ) -> None:
-        if DependantUtils.is_scalar_field(field=param_field):
+        if (
+            param_field.field_info.__class__ in _SCALAR_FAST_PARAM_TYPES
+            and param_field.type_ in _SCALAR_FAST_TYPES
+            and param_field.shape == SHAPE_SINGLETON
+            and not param_field.sub_fields
+        ):
+            # the common `name: int = Query(...)`, plainly scalar
+            self._add_scalar_field(param_field=param_field)
+        elif DependantUtils.is_scalar_field(field=param_field):
             self._add_scalar_field(param_field=param_field)
         elif isinstance(
             param.default, (params.Query, params.Header)
@@ -63,19 +233,13 @@ class Dependant(object):
         """Add param_field to path or query or header or cookie params"""
         field_info = cast(params.Param, param_field.field_info)
 
-        if field_info.in_ == params.ParamTypes.path:
-            self.path_params.append(param_field)
-        elif field_info.in_ == params.ParamTypes.query:
-            self.query_params.append(param_field)
-        elif field_info.in_ == params.ParamTypes.header:
-            self.header_params.append(param_field)
-        elif field_info.in_ == params.ParamTypes.cookie:
-            self.cookie_params.append(param_field)
-        else:
+        attr = _SCALAR_PARAMS_ATTRS.get(getattr(field_info, "in_", None))
+        if attr is None:
             raise Exception(
                 f"non-body parameters must be in "
                 f"path, query, header or cookie: {param_field.name}"
             )
+        getattr(self, attr).append(param_field)
 
     def _add_body_field(self, param_field: ModelField) -> None:
         if not isinstance(param_field.field_info, params.Body):
@@ -100,16 +264,36 @@ class Dependant(object):
         parent_dependant: Optional["Dependant"] = None,
         is_view_func: bool = False,
     ) -> "Dependant":
-        """Analyzing method parameters to obtain dependencies"""
+        """
+        Analyzing method parameters to obtain dependencies, the analysis runs
+        once per callable and every caller gets its own copy of the result
+        """
+        try:
+            templates = _DEPENDANT_CACHE[call]
+        except KeyError:
+            templates = _DEPENDANT_CACHE[call] = {}
+        except TypeError:
+            # unhashable, don't cache it
+            templates = {}
+
+        template = templates.get(is_view_func)
+        if template is None:
+            template = cls._new_dependant(call=call, is_view_func=is_view_func)
+            templates[is_view_func] = template
+
+        return template.copy(name=name, parent_dependant=parent_dependant)
+
+    @classmethod
+    def _new_dependant(cls, call: Callable, is_view_func: bool) -> "Dependant":
         signature = DependantUtils.get_typed_signature(call=call)
-        signature_params: List[inspect.Parameter] = list(signature.parameters.values())
+        signature_params = signature.parameters
 
         if not signature_params:
             raise Exception(
                 "The django view function must have at least a request argument"
             )
 
-        ismethod = True if signature_params[0].name == "self" else False
+        ismethod = next(iter(signature_params)) == "self"
 
         if is_view_func and ismethod and len(signature_params) < 2:
             raise Exception("The django view function is missing a request parameter.")
@@ -117,18 +301,13 @@ class Dependant(object):
         dependant = Dependant(
             call=call,
             ismethod=ismethod,
-            name=name,
-            parent_dependant=parent_dependant,
             is_view_func=is_view_func,
         )
 
-        typed_params = signature_params
-
-        for param in typed_params:
-
-            if param.name == "self":
-                continue
+        # ``self`` can only be the first param, skip it by position
+        start = 1 if ismethod else 0
 
+        for param in islice(signature_params.values(), start, None):
             if isinstance(param.default, params.Depends):
                 sub_dependant = dependant.new_param_sub_dependant(param=param)
                 dependant.dependencies.append(sub_dependant)
@@ -144,6 +323,24 @@ class Dependant(object):
 
         return dependant
 
+    def copy(
+        self,
+        *,
+        name: Optional[str] = None,
+        parent_dependant: Optional["Dependant"] = None,
+    ) -> "Dependant":
+        """
+        Shallow copy sharing the param fields, with its own dependencies list
+        so that callers may add sub-dependencies to it
+        """
+        dependant = copy(self)
+        dependant.name = name
+        dependant.parent_dependant = parent_dependant
+        dependant.dependencies = list(self.dependencies)
+        dependant._flat = None
+        dependant._body_fields = {}
+        return dependant
+
     def new_param_sub_dependant(self, param: inspect.Parameter) -> "Dependant":
         depends: params.Depends = param.default
 
@@ -167,7 +364,10 @@ class Dependant(object):
         return sub_dependant
 
     def flat(self) -> "Dependant":
-        """Flatten all params"""
+        """Flatten all params, built once and reused after freeze()"""
+        if self._flat is not None:
+            return self._flat
+
         flat_dependant = Dependant(
             path_params=self.path_params.copy(),
             query_params=self.query_params.copy(),
@@ -199,7 +399,24 @@ class Dependant(object):
     def get_body_field(self, *, name: str) -> Optional[ModelField]:
         """
         name: must be unique
+
+        The combined body model is built once per name, later calls (e.g. while
+        generating the schema) get the same field back.
         """
+        try:
+            return self._body_fields[name]
+        except KeyError:
+            pass
+
+        body_field = self._get_body_field(name=name)
+        self._body_fields[name] = body_field
+        return body_field
+
+    def _get_body_field(self, *, name: str) -> Optional[ModelField]:
+        if not self.has_body_params():
+            # don't flatten the whole tree just to find no body
+            return None
+
         flat_dependant = self.flat()
 
         if not flat_dependant.body_params:
@@ -212,37 +429,37 @@ class Dependant(object):
         if len(param_name_set) == 1 and not first_param_embed:
             return first_param
 
-        for param in flat_dependant.body_params:
-            setattr(param.field_info, "embed", True)
-
         model_name = "Body_" + name
         BodyModel = create_model(model_name)
 
+        # a single pass collecting everything needed to pick the body field info
+        required = False
+        has_file = False
+        has_form = False
+        body_param_media_types = set()
         for param in flat_dependant.body_params:
+            field_info = param.field_info
+            setattr(field_info, "embed", True)
             BodyModel.__fields__[param.name] = param
-
-        required = any(True for f in flat_dependant.body_params if f.required)
+            required = required or bool(param.required)
+            # File is a Form is a Body
+            if isinstance(field_info, params.Body):
+                body_param_media_types.add(field_info.media_type)
+                if isinstance(field_info, params.Form):
+                    has_form = True
+                    if isinstance(field_info, params.File):
+                        has_file = True
 
         BodyFieldInfo_kwargs: Dict[str, Any] = dict(default=None)
-        if any(
-            isinstance(param.field_info, params.File)
-            for param in flat_dependant.body_params
-        ):
+        if has_file:
             BodyFieldInfo: Type[params.Body] = params.File
-        elif any(
-            isinstance(f.field_info, params.Form) for f in flat_dependant.body_params
-        ):
+        elif has_form:
             BodyFieldInfo = params.Form
         else:
             BodyFieldInfo = params.Body
 
-            body_param_media_types = [
-                getattr(f.field_info, "media_type")
-                for f in flat_dependant.body_params
-                if isinstance(f.field_info, params.Body)
-            ]
-            if len(set(body_param_media_types)) == 1:
-                BodyFieldInfo_kwargs["media_type"] = body_param_media_types[0]
+            if len(body_param_media_types) == 1:
+                (BodyFieldInfo_kwargs["media_type"],) = body_param_media_types
         final_field = DependantUtils.create_model_field(
             name="body",
             type_=BodyModel,
@@ -280,34 +497,28 @@ class Dependant(object):
                 errors.extend(sub_errors)
                 continue
 
-            value = call(**sub_values)
+            if sub_dependant.positional_args is None:
+                value = call(**sub_values)
+            else:
+                value = call(*sub_dependant.positional_args(sub_values))
 
             if sub_dependant.name is not None:
                 values[sub_dependant.name] = value
 
-        path_values, path_errors = RequestConverter.to_args(
-            param_fields=self.path_params, param_values=path_kwargs
-        )
-        query_values, query_errors = RequestConverter.to_args(
-            param_fields=self.query_params, param_values=request.GET
-        )
-        header_values, header_errors = RequestConverter.to_args(
-            param_fields=self.header_params, param_values=request.headers
-        )
-        cookie_values, cookie_errors = RequestConverter.to_args(
-            param_fields=self.cookie_params, param_values=request.COOKIES
-        )
-
-        values.update(path_values)
-        values.update(query_values)
-        values.update(header_values)
-        values.update(cookie_values)
-
-        errors += path_errors + query_errors + header_errors + cookie_errors
+        for param_table, get_values in self.param_bindings:
+            RequestConverter.bind_args(
+                param_table=param_table,
+                param_values=get_values(request, path_kwargs),
+                values=values,
+                errors=errors,
+            )
 
         if self.body_params:
             body_values, body_errors = RequestConverter.to_body(
-                param_fields=self.body_params, body=body, is_body_form=is_body_form
+                param_table=self.body_table,
+                body=body,
+                alias_omitted=self.body_alias_omitted,
+                is_body_form=is_body_form,
             )
             values.update(body_values)
             errors.extend(body_errors)
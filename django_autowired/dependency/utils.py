@@ -1,12 +1,15 @@
+from copy import copy
 from copy import deepcopy
 from dataclasses import is_dataclass
-import functools
+from enum import Enum
+from functools import lru_cache
 import inspect
 from typing import Any
 from typing import Callable
 from typing import cast
 from typing import Dict
 from typing import List
+from typing import NamedTuple
 from typing import Optional
 from typing import Tuple
 from typing import Type
@@ -37,16 +40,86 @@ from pydantic.fields import UndefinedType
 from pydantic.schema import get_annotation_from_field_info
 from pydantic.typing import evaluate_forwardref
 from pydantic.typing import ForwardRef
+from pydantic.typing import get_all_type_hints
 from pydantic.utils import lenient_issubclass
 
+# header params are exposed with dashes: user_agent -> user-agent
+HEADER_ALIAS_TRANS = str.maketrans({"_": "-"})
+
 SEQUENCE_TYPES = (list, set, tuple)
-SEQUENCE_SHAPES = {
-    SHAPE_LIST,
-    SHAPE_SET,
-    SHAPE_TUPLE,
-    SHAPE_SEQUENCE,
-    SHAPE_TUPLE_ELLIPSIS,
-}
+SEQUENCE_TYPES_WITH_DICT = SEQUENCE_TYPES + (dict,)
+SEQUENCE_SHAPES = frozenset(
+    (
+        SHAPE_LIST,
+        SHAPE_SET,
+        SHAPE_TUPLE,
+        SHAPE_SEQUENCE,
+        SHAPE_TUPLE_ELLIPSIS,
+    )
+)
+
+
+class ParamTable(NamedTuple):
+    """
+    Flattened view of a list of param fields, built once per view so that
+    resolving a request only walks flat tuples instead of ModelField attributes.
+    """
+
+    # per field: (name, alias, sequence, required, default, default_copier,
+    # validate, loc, missing_error), the missing error is prebuilt since a
+    # missing field always reports the same error at the same loc
+    rows: Tuple[Tuple, ...]
+    # read by to_body, when a single body param is the whole body
+    aliases: Tuple[str, ...]
+
+
+# Callables are static after import. A strong cache that lives as long as the
+# process, like _DEPENDANT_CACHE, which keeps every analysed callable anyway.
+_TYPED_SIGNATURE_CACHE: Dict[Callable, inspect.Signature] = {}
+
+
+_IMMUTABLE_TYPES = (type(None), str, bytes, int, float, bool, Enum)
+_IMMUTABLE_CONTAINERS = (tuple, frozenset)
+_SHALLOW_CONTAINERS = (list, set, dict)
+
+
+def _is_immutable(value: Any) -> bool:
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return True
+    if isinstance(value, _IMMUTABLE_CONTAINERS):
+        return all(_is_immutable(item) for item in value)
+    return False
+
+
+@lru_cache(maxsize=1024)
+def _cached_issubclass(type_: Any, classinfo: Any) -> bool:
+    return lenient_issubclass(type_, classinfo)
+
+
+def cached_lenient_issubclass(type_: Any, classinfo: Any) -> bool:
+    """
+    lenient_issubclass memoized per (type_, classinfo), classinfo should be
+    a module-level constant. Unhashable types fall through uncached.
+    """
+    try:
+        return _cached_issubclass(type_, classinfo)
+    except TypeError:
+        return lenient_issubclass(type_, classinfo)
+
+
+def get_default_copier(default: Any) -> Optional[Callable[[Any], Any]]:
+    """
+    How to copy a param default so that requests never share a mutable one,
+    None when it can be used as is. Picked once per field, deepcopy is only
+    kept for defaults holding nested mutable values.
+    """
+    if _is_immutable(default):
+        return None
+    if type(default) in _SHALLOW_CONTAINERS:
+        items = default.values() if isinstance(default, dict) else default
+        if all(_is_immutable(item) for item in items):
+            return copy
+    return deepcopy
 
 
 def get_missing_field_error(loc: Tuple[str, ...]) -> ErrorWrapper:
@@ -62,7 +135,7 @@ class DependantUtils(object):
         """Wrapper param to pydantic ModelField"""
         default_value = Required
         had_schema = False
-        if param.default != param.empty:
+        if param.default is not param.empty:
             default_value = param.default
 
         # wrapper default_value to spec param
@@ -78,16 +151,16 @@ class DependantUtils(object):
         else:
             field_info = default_field_info_class(default_value)
 
-        required = default_value == Required
+        required = default_value is Required
         annotation: Any = Any
-        if not param.annotation == param.empty:
+        if param.annotation is not param.empty:
             annotation = param.annotation
 
         annotation = get_annotation_from_field_info(annotation, field_info, param.name)
 
         if not field_info.alias and getattr(field_info, "convert_underscores", None):
             # header
-            alias = param.name.replace("_", "-")
+            alias = param.name.translate(HEADER_ALIAS_TRANS)
         else:
             alias = field_info.alias or param.name
 
@@ -107,23 +180,25 @@ class DependantUtils(object):
 
     @classmethod
     def is_scalar_field(cls, field: ModelField) -> bool:
-        field_info = field.field_info
-        if (
-            field.shape != SHAPE_SINGLETON
-            or lenient_issubclass(field.type_, BaseModel)
-            or lenient_issubclass(field.type_, SEQUENCE_TYPES + (dict,))
-            or isinstance(field_info, Body)
-        ):
-            return False
-
-        if field.sub_fields:
-            if not all(cls.is_scalar_field(f) for f in field.sub_fields):
+        # worklist over the field and its nested sub_fields
+        stack = [field]
+        while stack:
+            field = stack.pop()
+            if (
+                field.shape != SHAPE_SINGLETON
+                or cached_lenient_issubclass(field.type_, BaseModel)
+                or cached_lenient_issubclass(field.type_, SEQUENCE_TYPES_WITH_DICT)
+                or isinstance(field.field_info, Body)
+            ):
                 return False
+
+            if field.sub_fields:
+                stack.extend(field.sub_fields)
         return True
 
     @classmethod
     def is_scalar_sequence_field(cls, field: ModelField) -> bool:
-        if (field.shape in SEQUENCE_SHAPES) and not lenient_issubclass(
+        if (field.shape in SEQUENCE_SHAPES) and not cached_lenient_issubclass(
             field.type_, BaseModel
         ):
             if field.sub_fields is not None:
@@ -131,7 +206,7 @@ class DependantUtils(object):
                     if not cls.is_scalar_field(sub_field):
                         return False
             return True
-        if lenient_issubclass(field.type_, SEQUENCE_TYPES):
+        if cached_lenient_issubclass(field.type_, SEQUENCE_TYPES):
             return True
         return False
 
@@ -154,19 +229,17 @@ class DependantUtils(object):
         class_validators = class_validators or {}
         field_info = field_info or FieldInfo(None)
 
-        response_field = functools.partial(
-            ModelField,
-            name=name,
-            type_=type_,
-            class_validators=class_validators,
-            default=default,
-            required=required,
-            model_config=model_config,
-            alias=alias,
-        )
-
         try:
-            return response_field(field_info=field_info)
+            return ModelField(
+                name=name,
+                type_=type_,
+                class_validators=class_validators,
+                default=default,
+                required=required,
+                model_config=model_config,
+                alias=alias,
+                field_info=field_info,
+            )
         except RuntimeError:
             raise Exception(
                 "Invalid args for response field!"
@@ -226,22 +299,56 @@ class DependantUtils(object):
 
     @classmethod
     def get_typed_signature(cls, call: Callable) -> inspect.Signature:
+        """Typed signature of `call`, computed once per callable"""
+        try:
+            return _TYPED_SIGNATURE_CACHE[call]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable, don't cache it
+            return cls._get_typed_signature(call=call)
+
+        typed_signature = cls._get_typed_signature(call=call)
+        _TYPED_SIGNATURE_CACHE[call] = typed_signature
+        return typed_signature
+
+    @classmethod
+    def _get_typed_signature(cls, call: Callable) -> inspect.Signature:
         signature = inspect.signature(call)
         # call global namespace
         globalns = getattr(call, "__globals__", {})
 
+        signature_params = signature.parameters.values()
+        if not any(isinstance(param.annotation, str) for param in signature_params):
+            # nothing to resolve, which is the common case
+            return signature
+
+        # resolve every forward ref in one pass, per param only as a fallback
+        hints = cls.get_type_hints(call)
         typed_params = [
-            inspect.Parameter(
-                name=param.name,
-                kind=param.kind,
-                default=param.default,
-                annotation=cls.get_typed_annotation(param, globalns),
+            param.replace(
+                annotation=hints[param.name]
+                if param.name in hints
+                else cls.get_typed_annotation(param, globalns)
             )
-            for param in signature.parameters.values()
+            if isinstance(param.annotation, str)
+            else param
+            for param in signature_params
         ]
         typed_signature = inspect.Signature(typed_params)
         return typed_signature
 
+    @classmethod
+    def get_type_hints(cls, call: Callable) -> Dict[str, Any]:
+        """Evaluated annotations of a plain function or method, {} otherwise"""
+        if not (inspect.isfunction(call) or inspect.ismethod(call)):
+            # e.g. a class, whose hints would be its attributes
+            return {}
+        try:
+            return get_all_type_hints(call)
+        except Exception:
+            return {}
+
     @classmethod
     def get_typed_annotation(
         cls, param: inspect.Parameter, globalns: Dict[str, Any]
@@ -256,107 +363,185 @@ class DependantUtils(object):
 
 class RequestConverter(object):
     @classmethod
-    def to_args(
+    def to_table(cls, param_fields: List[ModelField]) -> ParamTable:
+        for field in param_fields:
+            assert isinstance(
+                field.field_info, params.Param
+            ), "Param must be subclasses of Param"
+
+        return cls._to_table(
+            param_fields=param_fields,
+            sequences=[
+                DependantUtils.is_scalar_sequence_field(field=field)
+                for field in param_fields
+            ],
+            locs=[
+                (cast(Param, field.field_info).in_.value, field.alias)
+                for field in param_fields
+            ],
+        )
+
+    @classmethod
+    def is_body_alias_omitted(cls, param_fields: List[ModelField]) -> bool:
+        """A single, not embedded, body param is the whole body"""
+        return len(param_fields) == 1 and not getattr(
+            param_fields[0].field_info, "embed", False
+        )
+
+    @classmethod
+    def to_body_table(cls, param_fields: List[ModelField]) -> ParamTable:
+        alias_omitted = cls.is_body_alias_omitted(param_fields)
+        return cls._to_table(
+            param_fields=param_fields,
+            sequences=[
+                field.shape in SEQUENCE_SHAPES or field.type_ in SEQUENCE_TYPES
+                for field in param_fields
+            ],
+            locs=[
+                ("body",) if alias_omitted else ("body", field.alias)
+                for field in param_fields
+            ],
+        )
+
+    @classmethod
+    def _to_table(
         cls,
+        *,
         param_fields: List[ModelField],
+        sequences: List[bool],
+        locs: List[Tuple[str, ...]],
+    ) -> ParamTable:
+        aliases = tuple(field.alias for field in param_fields)
+        rows = []
+        for field, sequence, loc in zip(param_fields, sequences, locs):
+            rows.append(
+                (
+                    field.name,
+                    field.alias,
+                    sequence,
+                    bool(field.required),
+                    field.default,
+                    get_default_copier(field.default),
+                    field.validate,
+                    loc,
+                    get_missing_field_error(loc=loc),
+                )
+            )
+        return ParamTable(rows=tuple(rows), aliases=aliases)
+
+    @classmethod
+    def bind_args(
+        cls,
+        param_table: ParamTable,
         param_values: Union[Dict[str, Any], QueryDict, MultiValueDict],
-    ) -> Tuple[Dict[str, Any], List[ErrorWrapper]]:
-        values: Dict[str, Any] = {}
-        errors = []
-        for field in param_fields:
-            if DependantUtils.is_scalar_sequence_field(field=field) and isinstance(
-                param_values, QueryDict
-            ):
-                value = param_values.getlist(key=field.alias) or field.default
+        values: Dict[str, Any],
+        errors: List[ErrorWrapper],
+    ) -> None:
+        """Validate the table's params, collecting into values and errors"""
+        if not param_table.rows:
+            return
+
+        # loop invariant
+        is_query_dict = isinstance(param_values, QueryDict)
+        for (
+            name,
+            alias,
+            sequence,
+            required,
+            default,
+            copier,
+            validate,
+            loc,
+            missing_error,
+        ) in param_table.rows:
+            if sequence and is_query_dict:
+                value = param_values.getlist(alias) or default  # type: ignore
             else:
-                value = param_values.get(field.alias)
-
-            field_info = field.field_info
-
-            assert isinstance(
-                field_info, params.Param
-            ), "Param must be subclasses of Param"
+                value = param_values.get(alias)
 
             if value is None:
-                if field.required:
-                    errors.append(
-                        ErrorWrapper(
-                            MissingError(), loc=(field_info.in_.value, field.alias)
-                        )
-                    )
+                if required:
+                    errors.append(missing_error)
                     continue
+                elif copier is None:
+                    value = default
                 else:
-                    # values[field.name] = deepcopy(field.default)
-                    value = deepcopy(field.default)
+                    value = copier(default)
 
-            validate_value, validate_errors = field.validate(
-                v=value, values=values, loc=(field_info.in_.value, field.alias)
-            )
+            validate_value, validate_errors = validate(value, values, loc=loc)
 
-            if isinstance(validate_errors, ErrorWrapper):
+            if validate_errors is None:
+                values[name] = validate_value
+            elif validate_errors.__class__ is ErrorWrapper:
                 errors.append(validate_errors)
-            elif isinstance(validate_errors, list):
-                errors.extend(validate_errors)
             else:
-                values[field.name] = validate_value
-
-        return values, errors
+                errors.extend(validate_errors)
 
     @classmethod
     def to_body(
         cls,
-        param_fields: List[ModelField],
+        param_table: ParamTable,
         body: Optional[BodyType],
+        alias_omitted: bool = False,
         is_body_form: bool = False,
     ) -> Tuple[Dict[str, Any], List[ErrorWrapper]]:
-        values = {}
-        errors = []
-        if param_fields:
-            field = param_fields[0]
-            field_info = field.field_info
-            embed = getattr(field_info, "embed", False)
-            field_alias_omitted = len(param_fields) == 1 and not embed
-
-            if field_alias_omitted:
-                body = {field.alias: body}
-
-            for field in param_fields:
-                field_info = field.field_info
-                loc: Tuple[str, ...]
-                if field_alias_omitted:
-                    loc = ("body",)
+        values: Dict[str, Any] = {}
+        errors: List[ErrorWrapper] = []
+        if not param_table.rows:
+            return values, errors
+
+        if alias_omitted:
+            body = {param_table.aliases[0]: body}
+
+        # loop invariant
+        is_multi_value = isinstance(body, MultiValueDict)
+        for (
+            name,
+            alias,
+            sequence,
+            required,
+            default,
+            copier,
+            validate,
+            loc,
+            missing_error,
+        ) in param_table.rows:
+            value: Optional[Any] = None
+
+            if body is not None:
+                if sequence and is_multi_value:
+                    value = body.getlist(alias)
                 else:
-                    loc = ("body", field.alias)
-
-                value: Optional[Any] = None
-
-                if body is not None:
-                    if (
-                        field.shape in SEQUENCE_SHAPES or field.type_ in SEQUENCE_TYPES
-                    ) and isinstance(body, MultiValueDict):
-                        value = body.getlist(field.alias)
-                    else:
-                        try:
-                            value = body.get(field.alias)
-                        except AttributeError:
-                            errors.append(get_missing_field_error(loc))
-                            continue
-
-                if not value:
-                    if field.required:
-                        errors.append(get_missing_field_error(loc=loc))
-                    else:
-                        values[field.name] = deepcopy(field.default)
-
-                validate_value, validate_errors = field.validate(
-                    v=value, values=values, loc=loc
-                )
-
-                if isinstance(validate_errors, ErrorWrapper):
-                    errors.append(validate_errors)
-                elif isinstance(validate_errors, list):
-                    errors.extend(validate_errors)
+                    try:
+                        value = body.get(alias)
+                    except AttributeError:
+                        errors.append(missing_error)
+                        continue
+
+            # Falsy values such as 0 or [] are real values; only an empty
+            # form input counts as missing besides an absent one. A missing
+            # field is never validated, its default is used as is.
+            if (
+                value is None
+                or (is_body_form and value == "")
+                or (is_body_form and sequence and len(value) == 0)
+            ):
+                if required:
+                    errors.append(missing_error)
+                elif copier is None:
+                    values[name] = default
                 else:
-                    values[field.name] = validate_value
+                    values[name] = copier(default)
+                continue
+
+            validate_value, validate_errors = validate(value, values, loc=loc)
+
+            # pydantic gives back None, an ErrorWrapper or a list of them
+            if validate_errors is None:
+                values[name] = validate_value
+            elif validate_errors.__class__ is ErrorWrapper:
+                errors.append(validate_errors)
+            else:
+                errors.extend(validate_errors)
 
         return values, errors
@@ -1,12 +1,30 @@
 import http
 from typing import Any
+from typing import Optional
 from typing import Sequence
+from typing import Type
 
+from pydantic import BaseModel
 from pydantic import create_model
 from pydantic import ValidationError
 from pydantic.error_wrappers import ErrorList
 
-RequestErrorModel = create_model("Request")
+_REQUEST_ERROR_MODEL: Optional[Type[BaseModel]] = None
+
+
+def get_request_error_model() -> Type[BaseModel]:
+    """Built on first use, most requests never fail validation"""
+    global _REQUEST_ERROR_MODEL
+    if _REQUEST_ERROR_MODEL is None:
+        _REQUEST_ERROR_MODEL = create_model("Request")
+    return _REQUEST_ERROR_MODEL
+
+
+def __getattr__(name: str) -> Any:
+    # keep the former module attribute importable
+    if name == "RequestErrorModel":
+        return get_request_error_model()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class APIException(Exception):
@@ -20,4 +38,4 @@ class APIException(Exception):
 class RequestValidationError(ValidationError):
     def __init__(self, errors: Sequence[ErrorList], *, body: Any = None) -> None:
         self.body = body
-        super().__init__(errors, RequestErrorModel)
+        super().__init__(errors, get_request_error_model())
@@ -1,20 +1,71 @@
+from functools import lru_cache
+import json
+from typing import Any
+from typing import Callable
+from typing import Dict
 from typing import Optional
+from typing import Type
 
+from django.core.serializers.json import DjangoJSONEncoder
 from django.http.request import HttpRequest
 from django.http.response import HttpResponse
-from django.http.response import JsonResponse
 from django.utils.deprecation import MiddlewareMixin
 from django_autowired.exceptions import APIException
 from django_autowired.exceptions import RequestValidationError
+from pydantic.json import pydantic_encoder
+
+
+class _ErrorDetailEncoder(DjangoJSONEncoder):
+    def default(self, o: Any) -> Any:
+        try:
+            return super().default(o)
+        except TypeError:
+            # enums and models found in pydantic error contexts
+            return pydantic_encoder(o)
+
+
+def _dump_detail(detail: Any) -> bytes:
+    return json.dumps({"detail": detail}, cls=_ErrorDetailEncoder).encode("utf-8")
+
+
+# APIException details are mostly a handful of fixed messages
+_dump_cached_detail = lru_cache(maxsize=128, typed=True)(_dump_detail)
+
+
+def _handle_api_exception(exc: APIException) -> HttpResponse:
+    try:
+        content = _dump_cached_detail(exc.detail)
+    except TypeError:
+        # unhashable detail
+        content = _dump_detail(exc.detail)
+    return HttpResponse(
+        content, status=exc.status_code, content_type="application/json"
+    )
+
+
+def _handle_request_validation_error(exc: RequestValidationError) -> HttpResponse:
+    return HttpResponse(
+        _dump_detail(exc.errors()), status=400, content_type="application/json"
+    )
+
+
+# exact exception class -> handler, checked in order by isinstance for subclasses
+_EXCEPTION_HANDLERS: Dict[Type[Exception], Callable[[Any], HttpResponse]] = {
+    APIException: _handle_api_exception,
+    RequestValidationError: _handle_request_validation_error,
+}
 
 
 class AutoWiredExceptionMiddleware(MiddlewareMixin):
     def process_exception(
         self, request: HttpRequest, exc: Exception
     ) -> Optional[HttpResponse]:
-        if isinstance(exc, APIException):
-            return JsonResponse(status=exc.status_code, data={"detail": exc.detail})
-        elif isinstance(exc, RequestValidationError):
-            return JsonResponse(status=400, data={"detail": str(exc)})
-        else:
-            raise exc
+        handler = _EXCEPTION_HANDLERS.get(exc.__class__)
+        if handler is None:
+            for exc_class, exc_handler in _EXCEPTION_HANDLERS.items():
+                if isinstance(exc, exc_class):
+                    handler = exc_handler
+                    break
+            else:
+                raise exc
+        return handler(exc)
@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import lru_cache
 
 from django.http import HttpResponse
 
@@ -11,15 +12,8 @@ class DefaultUrl(Enum):
     swagger_favicon_url = "https://fastapi.tiangolo.com/img/favicon.png"
 
 
-def get_swagger_ui_html(
-    *,
-    openapi_url: str,
-    title: str,
-    swagger_js_url: str = DefaultUrl.swagger_js_url.value,
-    swagger_css_url: str = DefaultUrl.swagger_css_url.value,
-    swagger_favicon_url: str = DefaultUrl.swagger_favicon_url.value,
-) -> HttpResponse:
-    html = f"""
+# static apart from the five substituted values, JS braces are escaped
+_SWAGGER_UI_TEMPLATE = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -35,9 +29,7 @@ def get_swagger_ui_html(
     <script>
     const ui = SwaggerUIBundle({{
         url: '{openapi_url}',
-    """
 
-    html += """
         dom_id: '#swagger-ui',
         presets: [
         SwaggerUIBundle.presets.apis,
@@ -47,11 +39,40 @@ def get_swagger_ui_html(
         deepLinking: true,
         showExtensions: true,
         showCommonExtensions: true
-    })"""
-
-    html += """
+    }})
     </script>
     </body>
     </html>
     """
-    return HttpResponse(html)
+
+
+@lru_cache(maxsize=8)
+def _render_swagger_ui_html(
+    openapi_url: str,
+    title: str,
+    swagger_js_url: str,
+    swagger_css_url: str,
+    swagger_favicon_url: str,
+) -> bytes:
+    # docs urls are fixed per deployment, so this renders once
+    return _SWAGGER_UI_TEMPLATE.format(
+        openapi_url=openapi_url,
+        title=title,
+        swagger_js_url=swagger_js_url,
+        swagger_css_url=swagger_css_url,
+        swagger_favicon_url=swagger_favicon_url,
+    ).encode("utf-8")
+
+
+def get_swagger_ui_html(
+    *,
+    openapi_url: str,
+    title: str,
+    swagger_js_url: str = DefaultUrl.swagger_js_url.value,
+    swagger_css_url: str = DefaultUrl.swagger_css_url.value,
+    swagger_favicon_url: str = DefaultUrl.swagger_favicon_url.value,
+) -> HttpResponse:
+    html = _render_swagger_ui_html(
+        openapi_url, title, swagger_js_url, swagger_css_url, swagger_favicon_url
+    )
+    return HttpResponse(html, content_type="text/html; charset=utf-8")
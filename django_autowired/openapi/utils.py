@@ -1,5 +1,6 @@
 from collections import defaultdict
 from enum import Enum
+from functools import lru_cache
 from importlib import import_module
 from pathlib import PurePath
 import re
@@ -8,13 +9,18 @@ from typing import Any
 from typing import Callable
 from typing import cast
 from typing import Dict
+from typing import FrozenSet
 from typing import List
+from typing import Mapping
+from typing import MutableMapping
+from typing import NamedTuple
 from typing import Optional
 from typing import Sequence
 from typing import Set
 from typing import Tuple
 from typing import Type
 from typing import Union
+from weakref import WeakKeyDictionary
 
 from django.conf import settings
 from django.http.response import JsonResponse
@@ -61,6 +67,23 @@ validation_error_response_definition = {
     },
 }
 
+HTTP_422 = str(HTTP_422_UNPROCESSABLE_ENTITY)
+# an operation already declaring one of these gets no validation error response
+VALIDATION_STATUS_KEYS = (HTTP_422, "4XX", "default")
+
+# shared by every operation, the generated document only ever reads it
+validation_error_response = {
+    "description": "Validation Error",
+    "content": {
+        "application/json": {"schema": {"$ref": REF_PREFIX + "HTTPValidationError"}}
+    },
+}
+
+validation_error_definitions = {
+    "ValidationError": validation_error_definition,
+    "HTTPValidationError": validation_error_response_definition,
+}
+
 status_code_ranges: Dict[str, str] = {
     "1XX": "Information",
     "2XX": "Success",
@@ -70,32 +93,56 @@ status_code_ranges: Dict[str, str] = {
     "DEFAULT": "Default Response",
 }
 
+_OPERATION_ID_RE = re.compile("[^0-9a-zA-Z_]")
+_NAMED_GROUP_RE = re.compile(r"\(\?P(<\w+>)")
+_UNNAMED_GROUP_RE = re.compile(r"\(")
+_ESCAPE_RE = re.compile(r"\\(.)")
+_PATH_PARAMETER_RE = re.compile(r"{(?P<parameter>\w+)}")
+_PATH_PARAMETER_COMPONENT_RE = re.compile(
+    r"<(?:(?P<converter>[^>:]+):)?(?P<parameter>\w+)>"
+)
+
 SetIntStr = Set[Union[int, str]]
 DictIntStrAny = Dict[Union[int, str], Any]
+# id(field) -> schema, only valid for one get_openapi call (one model_name_map)
+SchemaCache = Dict[int, Dict[str, Any]]
+
+
+def get_field_schema(
+    field: ModelField,
+    *,
+    model_name_map: Dict[Union[Type[BaseModel], Type[Enum]], str],
+    schema_cache: Optional[SchemaCache] = None,
+) -> Dict[str, Any]:
+    if schema_cache is None:
+        schema_cache = {}
+    schema = schema_cache.get(id(field))
+    if schema is None:
+        # ignore mypy error until enum schemas are released
+        schema, _, _ = field_schema(
+            field, model_name_map=model_name_map, ref_prefix=REF_PREFIX  # type: ignore
+        )
+        schema_cache[id(field)] = schema
+    return schema
 
 
 def get_flat_models_from_routes(
     routes: Sequence[Callable],
 ) -> Set[Union[Type[BaseModel], Type[Enum]]]:
-    body_fields_from_routes: List[ModelField] = []
-    responses_from_routes: List[ModelField] = []
-    request_fields_from_routes: List[ModelField] = []
+    # the models found don't depend on the order the fields come in
+    fields_from_routes: List[ModelField] = []
     for route in routes:
-        if getattr(route, "include_in_schema", None) and isinstance(route, ViewRoute):
+        if isinstance(route, ViewRoute) and route.include_in_schema:
             if route.body_field:
                 assert isinstance(
                     route.body_field, ModelField
                 ), "A request body must be a Pydantic Field"
-                body_fields_from_routes.append(route.body_field)
+                fields_from_routes.append(route.body_field)
             if route.response_field:
-                responses_from_routes.append(route.response_field)
-            params = route.dependant.get_flat_params()
-            request_fields_from_routes.extend(params)
+                fields_from_routes.append(route.response_field)
+            fields_from_routes.extend(route.dependant.get_flat_params())
 
-    flat_models = get_flat_models_from_fields(
-        body_fields_from_routes + responses_from_routes + request_fields_from_routes,
-        known_models=set(),
-    )
+    flat_models = get_flat_models_from_fields(fields_from_routes, known_models=set())
     return flat_models
 
 
@@ -106,19 +153,23 @@ def get_model_definitions(
 ) -> Dict[str, Any]:
     definitions: Dict[str, Dict] = {}
     for model in flat_models:
+        model_name = model_name_map[model]
+        if model_name in definitions:
+            # already emitted as a nested definition of an earlier model,
+            # by the same model_process_schema call
+            continue
         # ignore mypy error until enum schemas are released
         m_schema, m_definitions, m_nested_models = model_process_schema(
             model, model_name_map=model_name_map, ref_prefix=REF_PREFIX  # type: ignore
         )
         definitions.update(m_definitions)
-        model_name = model_name_map[model]
         definitions[model_name] = m_schema
     return definitions
 
 
 def generate_operation_id_for_path(*, name: str, path: str, method: str) -> str:
     operation_id = name + path
-    operation_id = re.sub("[^0-9a-zA-Z_]", "_", operation_id)
+    operation_id = _OPERATION_ID_RE.sub("_", operation_id)
     operation_id = operation_id + "_" + method.lower()
     return operation_id
 
@@ -153,27 +204,26 @@ def get_openapi_operation_parameters(
     *,
     all_route_params: Sequence[ModelField],
     model_name_map: Dict[Union[Type[BaseModel], Type[Enum]], str],
-) -> List[Dict[str, Any]]:
-    parameters = []
+    schema_cache: Optional[SchemaCache] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Parameter objects by name, a later param overrides one with the same name"""
+    parameters: Dict[str, Dict[str, Any]] = {}
     for param in all_route_params:
         field_info = param.field_info
         field_info = cast(Param, field_info)
-        # ignore mypy error until enum schemas are released
         parameter = {
             "name": param.alias,
             "in": field_info.in_.value,
             "required": param.required,
-            "schema": field_schema(
-                param, model_name_map=model_name_map, ref_prefix=REF_PREFIX
-            )[
-                0
-            ],  # type: ignore
+            "schema": get_field_schema(
+                param, model_name_map=model_name_map, schema_cache=schema_cache
+            ),
         }
         if field_info.description:
             parameter["description"] = field_info.description
         if field_info.deprecated:
             parameter["deprecated"] = field_info.deprecated
-        parameters.append(parameter)
+        parameters[param.alias] = parameter
     return parameters
 
 
@@ -181,13 +231,13 @@ def get_openapi_operation_request_body(
     *,
     body_field: Optional[ModelField],
     model_name_map: Dict[Union[Type[BaseModel], Type[Enum]], str],
+    schema_cache: Optional[SchemaCache] = None,
 ) -> Optional[Dict]:
     if not body_field:
         return None
     assert isinstance(body_field, ModelField)
-    # ignore mypy error until enum schemas are released
-    body_schema, _, _ = field_schema(
-        body_field, model_name_map=model_name_map, ref_prefix=REF_PREFIX  # type: ignore
+    body_schema = get_field_schema(
+        body_field, model_name_map=model_name_map, schema_cache=schema_cache
     )
     field_info = cast(Body, body_field.field_info)
     request_media_type = field_info.media_type
@@ -200,80 +250,64 @@ def get_openapi_operation_request_body(
 
 
 def get_openapi_path(
-    *, route: ViewRoute, model_name_map: Dict[Type, str]
+    *,
+    route: ViewRoute,
+    model_name_map: Dict[Type, str],
+    schema_cache: Optional[SchemaCache] = None,
 ) -> Tuple[Dict, Dict]:
     path = {}
     definitions: Dict[str, Any] = {}
-    assert route.methods is not None, "Methods must be a list"
+    assert route.methods is not None, "Methods must be a tuple"
     assert route.response_class, "A response class is n" "eeded to generate OpenAPI"
     #
     route_response_media_type = "application/json"
+    if schema_cache is None:
+        schema_cache = {}
     if route.include_in_schema:
+        # the same for every method, the emitted document is never mutated
+        all_route_params = route.dependant.get_flat_params()
+        operation_parameters = get_openapi_operation_parameters(
+            all_route_params=all_route_params,
+            model_name_map=model_name_map,
+            schema_cache=schema_cache,
+        )
+        parameters = list(operation_parameters.values())
+        status_code = str(route.status_code)
+        response_content: Optional[Dict[str, Any]] = None
+        if route.status_code not in STATUS_CODES_WITH_NO_BODY:
+            response_schema = {"type": "string"}
+            if lenient_issubclass(route.response_class, JsonResponse):
+                if route.response_field:
+                    response_schema = get_field_schema(
+                        route.response_field,
+                        model_name_map=model_name_map,
+                        schema_cache=schema_cache,
+                    )
+                else:
+                    response_schema = {}
+            response_content = {route_response_media_type: {"schema": response_schema}}
         for method in route.methods:
             operation = get_openapi_operation_metadata(route=route, method=method)
-            parameters: List[Dict] = []
-            all_route_params = route.dependant.get_flat_params()
-            operation_parameters = get_openapi_operation_parameters(
-                all_route_params=all_route_params, model_name_map=model_name_map
-            )
-            parameters.extend(operation_parameters)
             if parameters:
-                operation["parameters"] = list(
-                    {param["name"]: param for param in parameters}.values()
-                )
+                operation["parameters"] = parameters
             if method in METHODS_WITH_BODY:
                 request_body_oai = get_openapi_operation_request_body(
-                    body_field=route.body_field, model_name_map=model_name_map
+                    body_field=route.body_field,
+                    model_name_map=model_name_map,
+                    schema_cache=schema_cache,
                 )
                 if request_body_oai:
                     operation["requestBody"] = request_body_oai
-            status_code = str(route.status_code)
-            operation.setdefault("responses", {}).setdefault(status_code, {})[
-                "description"
-            ] = route.response_description
-            if (
-                # route_response_media_type
-                route.status_code
-                not in STATUS_CODES_WITH_NO_BODY
-            ):
-                response_schema = {"type": "string"}
-                if lenient_issubclass(route.response_class, JsonResponse):
-                    if route.response_field:
-                        response_schema, _, _ = field_schema(
-                            route.response_field,
-                            model_name_map=model_name_map,
-                            ref_prefix=REF_PREFIX,
-                        )
-                    else:
-                        response_schema = {}
-                operation.setdefault("responses", {}).setdefault(
-                    status_code, {}
-                ).setdefault("content", {}).setdefault(route_response_media_type, {})[
-                    "schema"
-                ] = response_schema
-            http422 = str(HTTP_422_UNPROCESSABLE_ENTITY)
-            #
+            response: Dict[str, Any] = {"description": route.response_description}
+            if response_content is not None:
+                response["content"] = response_content
+            operation["responses"] = {status_code: response}
             if (all_route_params or route.body_field) and not any(
-                [
-                    status in operation["responses"]
-                    for status in [http422, "4XX", "default"]
-                ]
+                status in operation["responses"] for status in VALIDATION_STATUS_KEYS
             ):
-                operation["responses"][http422] = {
-                    "description": "Validation Error",
-                    "content": {
-                        "application/json": {
-                            "schema": {"$ref": REF_PREFIX + "HTTPValidationError"}
-                        }
-                    },
-                }
+                operation["responses"][HTTP_422] = validation_error_response
                 if "ValidationError" not in definitions:
-                    definitions.update(
-                        {
-                            "ValidationError": validation_error_definition,
-                            "HTTPValidationError": validation_error_response_definition,
-                        }
-                    )
+                    definitions.update(validation_error_definitions)
             path[method.lower()] = operation
 
     return path, definitions
@@ -301,10 +335,13 @@ def get_openapi(
     definitions = get_model_definitions(
         flat_models=flat_models, model_name_map=model_name_map  # type: ignore
     )
+    schema_cache: SchemaCache = {}
     # todo: security
     for route in routes:
         if isinstance(route, ViewRoute):
-            result = get_openapi_path(route=route, model_name_map=model_name_map)
+            result = get_openapi_path(
+                route=route, model_name_map=model_name_map, schema_cache=schema_cache
+            )
             if result:
                 path, path_definitions = result
                 if path:
@@ -333,6 +370,67 @@ def generate_encoders_by_class_tuples(
 encoders_by_class_tuples = generate_encoders_by_class_tuples(ENCODERS_BY_TYPE)
 
 
+# what jsonable_encoder does with a value, by its exact type first
+_KIND_MODEL = 0
+_KIND_ENUM = 1
+_KIND_PATH = 2
+_KIND_SCALAR = 3
+_KIND_DICT = 4
+_KIND_SEQUENCE = 5
+_KIND_OTHER = 6
+
+_SCALAR_TYPES: FrozenSet[type] = frozenset((str, int, float, bool, type(None)))
+_SEQUENCE_TYPES: Tuple[type, ...] = (list, set, frozenset, GeneratorType, tuple)
+_EXACT_KINDS: Dict[type, int] = {
+    **{type_: _KIND_SCALAR for type_ in _SCALAR_TYPES},
+    dict: _KIND_DICT,
+    **{type_: _KIND_SEQUENCE for type_ in _SEQUENCE_TYPES},
+}
+
+
+def _get_kind(obj: Any) -> int:
+    """isinstance fallback for subclasses, in the order the checks matter"""
+    if isinstance(obj, BaseModel):
+        return _KIND_MODEL
+    if isinstance(obj, Enum):
+        return _KIND_ENUM
+    if isinstance(obj, PurePath):
+        return _KIND_PATH
+    if isinstance(obj, (str, int, float, type(None))):
+        return _KIND_SCALAR
+    if isinstance(obj, dict):
+        return _KIND_DICT
+    if isinstance(obj, _SEQUENCE_TYPES):
+        return _KIND_SEQUENCE
+    return _KIND_OTHER
+
+
+# shared default, never written to
+_NO_ENCODERS: Dict[Any, Callable[[Any], Any]] = {}
+
+
+class _EncodeOptions(NamedTuple):
+    include: Optional[Set]
+    exclude: Optional[Set]
+    by_alias: bool
+    exclude_unset: bool
+    exclude_defaults: bool
+    exclude_none: bool
+    custom_encoder: Dict
+    sqlalchemy_safe: bool
+
+
+def _dict_item_options(options: _EncodeOptions) -> _EncodeOptions:
+    # include / exclude only apply to the top level keys of a dict
+    if (
+        options.include is None
+        and options.exclude is None
+        and not options.exclude_defaults
+    ):
+        return options
+    return options._replace(include=None, exclude=None, exclude_defaults=False)
+
+
 def jsonable_encoder(
     obj: Any,
     include: Optional[Union[SetIntStr, DictIntStrAny]] = None,
@@ -341,88 +439,131 @@ def jsonable_encoder(
     exclude_unset: bool = False,
     exclude_defaults: bool = False,
     exclude_none: bool = False,
-    custom_encoder: dict = {},
+    custom_encoder: Optional[Dict[Any, Callable[[Any], Any]]] = None,
     sqlalchemy_safe: bool = True,
 ) -> Any:
+    # normalized once here, not at every level of the document
     if include is not None and not isinstance(include, set):
         include = set(include)
     if exclude is not None and not isinstance(exclude, set):
         exclude = set(exclude)
-    if isinstance(obj, BaseModel):
-        encoder = getattr(obj.__config__, "json_encoders", {})
-        if custom_encoder:
-            encoder.update(custom_encoder)
-        obj_dict = obj.dict(
-            include=include,
-            exclude=exclude,
-            by_alias=by_alias,
-            exclude_unset=exclude_unset,
-            exclude_none=exclude_none,
-            exclude_defaults=exclude_defaults,
-        )
-        if "__root__" in obj_dict:
-            obj_dict = obj_dict["__root__"]
-        return jsonable_encoder(
-            obj_dict,
-            exclude_none=exclude_none,
-            exclude_defaults=exclude_defaults,
-            custom_encoder=encoder,
-            sqlalchemy_safe=sqlalchemy_safe,
-        )
-    if isinstance(obj, Enum):
-        return obj.value
-    if isinstance(obj, PurePath):
-        return str(obj)
-    if isinstance(obj, (str, int, float, type(None))):
-        return obj
-    if isinstance(obj, dict):
-        encoded_dict = {}
-        for key, value in obj.items():
-            if (
-                (
-                    not sqlalchemy_safe
-                    or (not isinstance(key, str))
-                    or (not key.startswith("_sa"))
-                )
-                and (value is not None or not exclude_none)
-                and ((include and key in include) or not exclude or key not in exclude)
-            ):
-                encoded_key = jsonable_encoder(
-                    key,
-                    by_alias=by_alias,
-                    exclude_unset=exclude_unset,
-                    exclude_none=exclude_none,
-                    custom_encoder=custom_encoder,
-                    sqlalchemy_safe=sqlalchemy_safe,
-                )
-                encoded_value = jsonable_encoder(
-                    value,
-                    by_alias=by_alias,
-                    exclude_unset=exclude_unset,
-                    exclude_none=exclude_none,
-                    custom_encoder=custom_encoder,
-                    sqlalchemy_safe=sqlalchemy_safe,
-                )
-                encoded_dict[encoded_key] = encoded_value
-        return encoded_dict
-    if isinstance(obj, (list, set, frozenset, GeneratorType, tuple)):
-        encoded_list = []
-        for item in obj:
-            encoded_list.append(
-                jsonable_encoder(
-                    item,
-                    include=include,
-                    exclude=exclude,
-                    by_alias=by_alias,
-                    exclude_unset=exclude_unset,
-                    exclude_defaults=exclude_defaults,
-                    exclude_none=exclude_none,
-                    custom_encoder=custom_encoder,
-                    sqlalchemy_safe=sqlalchemy_safe,
-                )
+    options = _EncodeOptions(
+        include=include,  # type: ignore
+        exclude=exclude,  # type: ignore
+        by_alias=by_alias,
+        exclude_unset=exclude_unset,
+        exclude_defaults=exclude_defaults,
+        exclude_none=exclude_none,
+        custom_encoder=custom_encoder or _NO_ENCODERS,
+        sqlalchemy_safe=sqlalchemy_safe,
+    )
+    return _encode(obj, options)
+
+
+_MISSING = object()
+
+
+def _encode(obj: Any, options: _EncodeOptions) -> Any:
+    """
+    Walk the value with an explicit stack instead of recursion. Containers
+    are created with their slots up front, so every pending value only
+    needs to know the slot its encoded form goes into.
+    """
+    result: List[Any] = [None]
+    stack: List[Tuple[Any, _EncodeOptions, Any, Any]] = [(obj, options, result, 0)]
+    while stack:
+        obj, options, container, slot = stack.pop()
+
+        kind = _EXACT_KINDS.get(type(obj))
+        if kind is None:
+            kind = _get_kind(obj)
+
+        if kind == _KIND_SCALAR:
+            container[slot] = obj
+        elif kind == _KIND_DICT:
+            include = options.include
+            exclude = options.exclude
+            exclude_none = options.exclude_none
+            sqlalchemy_safe = options.sqlalchemy_safe
+            item_options = _dict_item_options(options)
+            encoded_dict: Dict[Any, Any] = {}
+            pending = []
+            for key, value in obj.items():
+                if (
+                    (
+                        not sqlalchemy_safe
+                        or (not isinstance(key, str))
+                        or (not key.startswith("_sa"))
+                    )
+                    and (value is not None or not exclude_none)
+                    and (
+                        (include and key in include)
+                        or not exclude
+                        or key not in exclude
+                    )
+                ):
+                    if type(key) is not str:
+                        key = _encode(key, item_options)
+                    if type(value) in _SCALAR_TYPES and key not in encoded_dict:
+                        # leaves are stored right away instead of a stack round trip
+                        encoded_dict[key] = value
+                        continue
+                    # reserve the slot now to keep the key order
+                    encoded_dict[key] = None
+                    pending.append((value, item_options, encoded_dict, key))
+            # popped in order, so a later duplicate encoded key still wins
+            stack.extend(reversed(pending))
+            container[slot] = encoded_dict
+        elif kind == _KIND_SEQUENCE:
+            encoded_list = list(obj)
+            for idx, item in enumerate(encoded_list):
+                if type(item) not in _SCALAR_TYPES:
+                    # leaves are already in place
+                    stack.append((item, options, encoded_list, idx))
+            container[slot] = encoded_list
+        elif kind == _KIND_MODEL:
+            encoder = getattr(obj.__config__, "json_encoders", _NO_ENCODERS)
+            if options.custom_encoder:
+                # merged into a new dict, never into the model's config
+                encoder = {**encoder, **options.custom_encoder}
+            obj_dict = obj.dict(
+                include=options.include,
+                exclude=options.exclude,
+                by_alias=options.by_alias,
+                exclude_unset=options.exclude_unset,
+                exclude_none=options.exclude_none,
+                exclude_defaults=options.exclude_defaults,
             )
-        return encoded_list
+            if "__root__" in obj_dict:
+                obj_dict = obj_dict["__root__"]
+            model_options = _EncodeOptions(
+                include=None,
+                exclude=None,
+                by_alias=True,
+                exclude_unset=False,
+                exclude_defaults=options.exclude_defaults,
+                exclude_none=options.exclude_none,
+                custom_encoder=encoder,
+                sqlalchemy_safe=options.sqlalchemy_safe,
+            )
+            stack.append((obj_dict, model_options, container, slot))
+        elif kind == _KIND_ENUM:
+            container[slot] = obj.value
+        elif kind == _KIND_PATH:
+            container[slot] = str(obj)
+        else:
+            encoded = _encode_other(obj, options.custom_encoder)
+            if encoded is _MISSING:
+                data = _get_object_data(obj)
+                other_options = options._replace(include=None, exclude=None)
+                stack.append((data, other_options, container, slot))
+            else:
+                container[slot] = encoded
+    return result[0]
+
 
+def _encode_other(obj: Any, custom_encoder: Dict) -> Any:
+    """Encoded `obj` by the custom or pydantic encoders, _MISSING if none fits"""
     if custom_encoder:
         if type(obj) in custom_encoder:
             return custom_encoder[type(obj)](obj)
@@ -433,29 +574,42 @@ def jsonable_encoder(
 
     if type(obj) in ENCODERS_BY_TYPE:
         return ENCODERS_BY_TYPE[type(obj)](obj)
+    encoder = _get_class_encoder(type(obj))
+    if encoder is None:
+        return _MISSING
+    return encoder(obj)
+
+
+# concrete type -> encoder found in encoders_by_class_tuples, or None
+_CLASS_ENCODER_CACHE: MutableMapping[type, Optional[Callable]] = WeakKeyDictionary()
+
+
+def _get_class_encoder(type_: type) -> Optional[Callable]:
+    try:
+        return _CLASS_ENCODER_CACHE[type_]
+    except KeyError:
+        pass
+
+    found: Optional[Callable] = None
     for encoder, classes_tuple in encoders_by_class_tuples.items():
-        if isinstance(obj, classes_tuple):
-            return encoder(obj)
+        if issubclass(type_, classes_tuple):
+            found = encoder
+            break
+    _CLASS_ENCODER_CACHE[type_] = found
+    return found
 
+
+def _get_object_data(obj: Any) -> Dict:
     errors: List[Exception] = []
     try:
-        data = dict(obj)
+        return dict(obj)
     except Exception as e:
         errors.append(e)
         try:
-            data = vars(obj)
+            return vars(obj)
         except Exception as e:
             errors.append(e)
             raise ValueError(errors)
-    return jsonable_encoder(
-        data,
-        by_alias=by_alias,
-        exclude_unset=exclude_unset,
-        exclude_defaults=exclude_defaults,
-        exclude_none=exclude_none,
-        custom_encoder=custom_encoder,
-        sqlalchemy_safe=sqlalchemy_safe,
-    )
 
 
 class OpenAPISchemaGenerator(object):
@@ -467,7 +621,7 @@ class OpenAPISchemaGenerator(object):
         openapi_version: str = "3.0.2",
         description: Optional[str] = None,
         urlpatterns: Optional[List[URLPattern]] = None,
-        view_route: Dict[Callable, ViewRoute],
+        view_route: Mapping[Callable, ViewRoute],
     ):
         self.title = title
         self.version = version
@@ -475,6 +629,7 @@ class OpenAPISchemaGenerator(object):
         self.description = description
         self.patterns = urlpatterns
         self.view_route = view_route
+        self._schema: Optional[Dict] = None
 
         if urlpatterns is None:
             # Use the default Django URL conf
@@ -492,160 +647,129 @@ class OpenAPISchemaGenerator(object):
     def set_route_path(self):
         # get all path
         endpoints = self.get_api_endpoints()
-        routes = self.view_route
+        # a view mounted on several paths keeps the last one, as it always has
+        path_by_qualname = {callback.__qualname__: path for path, callback in endpoints}
         self.routes = []
-        for r in routes.keys():
-            fun_name = ".".join(r.__qualname__.split(".")[:-1])
-            for e in endpoints:
-                path, callback = e
-                if callback.__qualname__ == fun_name:
-                    routes[r].set_path(path)
-                    self.routes.append(routes[r])
-                    continue
+        for route in self.view_route.values():
+            fun_name = route.qualname.rpartition(".")[0]
+            path = path_by_qualname.get(fun_name)
+            if path is not None:
+                route.set_path(path)
+                self.routes.append(route)
 
     def get_api_endpoints(
         self,
         patterns: Optional[List[URLPattern]] = None,
         prefix: str = "",
-        app_name: Optional[str] = None,
-        namespace: Optional[str] = None,
         ignored_endpoints: Optional[Set] = None,
     ) -> List[Tuple[str, Any]]:
         if patterns is None:
             patterns = self.patterns
 
-        api_endpoints = []
+        api_endpoints: List[Tuple[str, Any]] = []
         if ignored_endpoints is None:
             ignored_endpoints = set()
 
-        if patterns:
-            for pattern in patterns:
-                path_regex = prefix + str(pattern.pattern)
-                if isinstance(pattern, URLPattern):
-                    try:
-                        path = self.get_path_from_regex(path_regex)
-                        callback = pattern.callback
-                        if path in ignored_endpoints:
-                            continue
-                        ignored_endpoints.add(path)
-
-                        endpoint = (path, callback)
-                        api_endpoints.append(endpoint)
-                    except Exception:
-                        logger.warning("failed to enumerate view", exc_info=True)
-
-                elif isinstance(pattern, URLResolver):
-                    nested_endpoints = self.get_api_endpoints(
-                        patterns=pattern.url_patterns,
-                        prefix=path_regex,
-                        app_name="%s:%s" % (app_name, pattern.app_name)
-                        if app_name
-                        else pattern.app_name,
-                        namespace="%s:%s" % (namespace, pattern.namespace)
-                        if namespace
-                        else pattern.namespace,
-                        ignored_endpoints=ignored_endpoints,
-                    )
-                    api_endpoints.extend(nested_endpoints)
-                else:
-                    raise TypeError(f"unknown pattern type {type(pattern)}")
+        # depth first over nested resolvers, each frame resumes its own
+        # patterns so endpoints come out in urlconf order
+        stack = [(iter(patterns or ()), prefix)]
+        while stack:
+            pattern_iter, prefix = stack[-1]
+            pattern = next(pattern_iter, None)
+            if pattern is None:
+                stack.pop()
+                continue
+
+            path_regex = prefix + str(pattern.pattern)
+            if isinstance(pattern, URLPattern):
+                try:
+                    path = self.get_path_from_regex(path_regex)
+                    callback = pattern.callback
+                    if path in ignored_endpoints:
+                        continue
+                    ignored_endpoints.add(path)
+
+                    endpoint = (path, callback)
+                    api_endpoints.append(endpoint)
+                except Exception:
+                    logger.warning("failed to enumerate view", exc_info=True)
+
+            elif isinstance(pattern, URLResolver):
+                stack.append((iter(pattern.url_patterns), path_regex))
+            else:
+                raise TypeError(f"unknown pattern type {type(pattern)}")
 
         return api_endpoints
 
     @staticmethod
-    def replace_named_groups(pattern: str) -> str:
+    def find_group_end(pattern: str, pos: int) -> Optional[int]:
+        """
+        Index just past the `)` closing the group whose body starts at `pos`,
+        None if the group is never closed
+        """
+        # Handle nested parentheses, e.g. '^(?P<a>(x|y))/b'.
+        unmatched_open_brackets, prev_char = 1, None
+        for idx in range(pos, len(pattern)):
+            val = pattern[idx]
+            # Check for unescaped `(` and `)`. They mark the start and end of a
+            # nested group.
+            if val == "(" and prev_char != "\\":
+                unmatched_open_brackets += 1
+            elif val == ")" and prev_char != "\\":
+                unmatched_open_brackets -= 1
+                if unmatched_open_brackets == 0:
+                    return idx + 1
+            prev_char = val
+        return None
+
+    @classmethod
+    def replace_named_groups(cls, pattern: str) -> str:
         r"""
         Find named groups in `pattern` and replace them with the group name. E.g.,
         1. ^(?P<a>\w+)/b/(\w+)$ ==> ^<a>/b/(\w+)$
         2. ^(?P<a>\w+)/b/(?P<c>\w+)/$ ==> ^<a>/b/<c>/$
         """
-        named_group_matcher = re.compile(r"\(\?P(<\w+>)")
-        named_group_indices = [
-            (m.start(0), m.end(0), m.group(1))
-            for m in named_group_matcher.finditer(pattern)
-        ]
-        # Tuples of (named capture group pattern, group name).
-        group_pattern_and_name = []
-        # Loop over the groups and their start and end indices.
-        for start, end, group_name in named_group_indices:
-            # Handle nested parentheses, e.g. '^(?P<a>(x|y))/b'.
-            unmatched_open_brackets, prev_char = 1, None
-            for idx, val in enumerate(list(pattern[end:])):
-                # If brackets are balanced, the end of the string for the current
-                # named capture group pattern has been reached.
-                if unmatched_open_brackets == 0:
-                    group_pattern_and_name.append(
-                        (pattern[start : end + idx], group_name)
-                    )
-                    break
-
-                # Check for unescaped `(` and `)`. They mark the start and end of a
-                # nested group.
-                if val == "(" and prev_char != "\\":
-                    unmatched_open_brackets += 1
-                elif val == ")" and prev_char != "\\":
-                    unmatched_open_brackets -= 1
-                prev_char = val
-
-        # Replace the string for named capture groups with their group names.
-        for group_pattern, group_name in group_pattern_and_name:
-            pattern = pattern.replace(group_pattern, group_name)
-        return pattern
+        parts: List[str] = []
+        prev_end = 0
+        for match in _NAMED_GROUP_RE.finditer(pattern):
+            start = match.start(0)
+            if start < prev_end:
+                # nested in a group that was already replaced
+                continue
+            end = cls.find_group_end(pattern, match.end(0))
+            if end is None:
+                continue
+            parts.append(pattern[prev_end:start])
+            parts.append(match.group(1))
+            prev_end = end
+        parts.append(pattern[prev_end:])
+        return "".join(parts)
 
-    @staticmethod
-    def replace_unnamed_groups(pattern: str) -> str:
+    @classmethod
+    def replace_unnamed_groups(cls, pattern: str) -> str:
         r"""
         Find unnamed groups in `pattern` and replace them with '<var>'. E.g.,
         1. ^(?P<a>\w+)/b/(\w+)$ ==> ^(?P<a>\w+)/b/<var>$
         2. ^(?P<a>\w+)/b/((x|y)\w+)$ ==> ^(?P<a>\w+)/b/<var>$
         """
-        unnamed_group_matcher = re.compile(r"\(")
-        unnamed_group_indices = [
-            m.start(0) for m in unnamed_group_matcher.finditer(pattern)
-        ]
-        # Indices of the start of unnamed capture groups.
-        group_indices = []
-        # Loop over the start indices of the groups.
-        for start in unnamed_group_indices:
-            # Handle nested parentheses, e.g. '^b/((x|y)\w+)$'.
-            unmatched_open_brackets, prev_char = 1, None
-            for idx, val in enumerate(list(pattern[start + 1 :])):
-                if unmatched_open_brackets == 0:
-                    group_indices.append((start, start + 1 + idx))
-                    break
-
-                # Check for unescaped `(` and `)`. They mark the start and end of
-                # a nested group.
-                if val == "(" and prev_char != "\\":
-                    unmatched_open_brackets += 1
-                elif val == ")" and prev_char != "\\":
-                    unmatched_open_brackets -= 1
-                prev_char = val
-
-        # Remove unnamed group matches inside other unnamed capture groups.
-        group_start_end_indices = []
-        prev_end = None
-        for start, end in group_indices:
-            if prev_end and start > prev_end or not prev_end:
-                group_start_end_indices.append((start, end))
+        parts: List[str] = []
+        prev_end = 0
+        for match in _UNNAMED_GROUP_RE.finditer(pattern):
+            start = match.start(0)
+            if start < prev_end:
+                # nested in a group that was already replaced
+                continue
+            end = cls.find_group_end(pattern, start + 1)
+            if end is None:
+                continue
+            parts.append(pattern[prev_end:start])
+            parts.append("<var>")
             prev_end = end
-
-        if group_start_end_indices:
-            # Replace unnamed groups with <var>. Handle the fact that replacing the
-            # string between indices will change string length and thus indices
-            # will point to the wrong substring if not corrected.
-            final_pattern, prev_end = [], None
-            for start, end in group_start_end_indices:
-                if prev_end:
-                    final_pattern.append(pattern[prev_end:start])
-                final_pattern.append(pattern[:start] + "<var>")
-                prev_end = end
-            final_pattern.append(pattern[prev_end:])
-            return "".join(final_pattern)
-        else:
-            return pattern
+        parts.append(pattern[prev_end:])
+        return "".join(parts)
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def simplify_regex(cls, pattern: str) -> str:
         r"""
         Clean up urlpattern regexes into something more readable by humans. For
@@ -666,9 +790,12 @@ class OpenAPISchemaGenerator(object):
         :param str s: string with backslash escapes
         :rtype: str
         """
+        if "\\" not in s:
+            # nothing escaped, the common case
+            return s
         # unlike .replace('\\', ''), this corectly transforms a double backslash
         # into a single backslash
-        return re.sub(r"\\(.)", r"\1", s)
+        return _ESCAPE_RE.sub(r"\1", s)
 
     @classmethod
     def unescape_path(cls, path: str) -> str:
@@ -683,38 +810,37 @@ class OpenAPISchemaGenerator(object):
         :return: the unescaped path
         :rtype: str
         """
-        PATH_PARAMETER_RE = re.compile(r"{(?P<parameter>\w+)}")
-        clean_path = ""
-        while path:
-            match = PATH_PARAMETER_RE.search(path)
-            if not match:
-                clean_path += cls.unescape(path)
-                break
-            clean_path += cls.unescape(path[: match.start()])
-            clean_path += match.group()
-            path = path[match.end() :]
-        return clean_path
+        parts: List[str] = []
+        prev_end = 0
+        for match in _PATH_PARAMETER_RE.finditer(path):
+            parts.append(cls.unescape(path[prev_end : match.start()]))
+            parts.append(match.group())
+            prev_end = match.end()
+        parts.append(cls.unescape(path[prev_end:]))
+        return "".join(parts)
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def get_path_from_regex(cls, path_regex: str):
+        """Pure in `path_regex`, cached across generators walking the same urlconf"""
         if path_regex.endswith(")"):
             logger.warning(
                 "url pattern does not end in $ ('%s') - unexpected things might happen",
                 path_regex,
             )
         path = cls.simplify_regex(path_regex)
-        _PATH_PARAMETER_COMPONENT_RE = re.compile(
-            r"<(?:(?P<converter>[^>:]+):)?(?P<parameter>\w+)>"
-        )
         # Strip Django 2.0 convertors as they are incompatible with uritemplate format
-        res = re.sub(_PATH_PARAMETER_COMPONENT_RE, r"{\g<parameter>}", path)
+        res = _PATH_PARAMETER_COMPONENT_RE.sub(r"{\g<parameter>}", path)
         return cls.unescape_path(res)
 
     def get_schema(self) -> Dict:
-        return get_openapi(
-            title=self.title,
-            version=self.version,
-            openapi_version=self.openapi_version,
-            description=self.description,
-            routes=self.routes,
-        )
+        """Generated on the first call, routes don't change afterwards"""
+        if self._schema is None:
+            self._schema = get_openapi(
+                title=self.title,
+                version=self.version,
+                openapi_version=self.openapi_version,
+                description=self.description,
+                routes=self.routes,
+            )
+        return self._schema
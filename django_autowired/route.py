@@ -1,14 +1,19 @@
 import re
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import FrozenSet
 from typing import List
+from typing import Mapping
 from typing import Optional
 from typing import Pattern
 from typing import Set
 from typing import Tuple
 from typing import Type
 
+from django.http.request import HttpRequest
 from django.http.response import HttpResponse
 from django.http.response import JsonResponse
 from django_autowired import params
@@ -16,18 +21,62 @@ from django_autowired.dependency.models import Dependant
 from django_autowired.dependency.utils import DependantUtils
 from django_autowired.openapi.convertors import Convertor
 from django_autowired.openapi.convertors import CONVERTOR_TYPES
+from django_autowired.typing import BodyType
+from django_autowired.utils import BodyConverter
 from django_autowired.utils import get_view_name
+from pydantic import BaseModel
 from pydantic.fields import ModelField
 
 ViewFunc = Callable
 
+BODY_MODE_NONE = 0
+BODY_MODE_JSON = 1
+BODY_MODE_FORM = 2
+# indexed by body mode
+BODY_PARSERS: Tuple[Optional[Callable[[HttpRequest], BodyType]], ...] = (
+    None,
+    BodyConverter.to_json,
+    BodyConverter.to_form,
+)
+
+# Response models cloned so far, shared by every route so that a model used as
+# response_model by several views is only cloned once
+_CLONED_RESPONSE_TYPES: Dict[Type[BaseModel], Type[BaseModel]] = {}
+
 # Match parameters in URL paths, eg.
-PARAM_REGEX = re.compile("<([a-zA-Z_][a-zA-Z0-9_]*)(:[a-zA-Z_][a-zA-Z0-9_]*)?>")
+PARAM_REGEX = re.compile(
+    r"<([a-zA-Z_][a-zA-Z0-9_]*)(:[a-zA-Z_][a-zA-Z0-9_]*)?>", re.ASCII
+)
+
+# characters re.escape() would escape
+_RE_META = frozenset("()[]{}?*+-|^$\\.&~# \t\n\r\v\f")
+
+
+def _escape_literal(literal: str) -> str:
+    if _RE_META.isdisjoint(literal):
+        return literal
+    return re.escape(literal)
+
+
+# convertor type -> (convertor, tail of its named group), the group name is
+# the only part that varies between parameters
+_CONVERTOR_GROUPS: Dict[str, Tuple[Convertor, str]] = {
+    convertor_type: (convertor, f">{convertor.regex})")
+    for convertor_type, convertor in CONVERTOR_TYPES.items()
+}
 
+# every route starts out with an empty path
+_EMPTY_PATH: Tuple[Pattern[str], str, Mapping[str, Convertor]] = (
+    re.compile("^$"),
+    "",
+    MappingProxyType({}),
+)
 
+
+@lru_cache(maxsize=1024)
 def compile_path(
     path: str,
-) -> Tuple[Pattern[str], str, Dict[str, Convertor]]:
+) -> Tuple[Pattern[str], str, Mapping[str, Convertor]]:
     """
     Given a path string, like: "/<username:str>", return a three-tuple
     of (regex, format, {param_name:convertor}).
@@ -35,36 +84,93 @@ def compile_path(
     regex:      "/(?P<username>[^/]+)"
     format:     "/{username}"
     convertors: {"username": StringConvertor()}
-    """
-    path_regex = "^"
-    path_format = ""
 
-    idx = 0
+    Results are cached and shared, so the convertors mapping is read-only.
+    """
+    if not path:
+        return _EMPTY_PATH
+    regex_parts: List[str] = ["^"]
+    format_parts: List[str] = []
     param_convertors = {}
-    for match in PARAM_REGEX.finditer(path):
-        param_name, convertor_type = match.groups("str")
-        convertor_type = convertor_type.lstrip(":")
-        assert (
-            convertor_type in CONVERTOR_TYPES
-        ), f"Unknown path convertor '{convertor_type}'"
-        convertor = CONVERTOR_TYPES[convertor_type]
+    # locals for the loop below
+    convertor_groups = _CONVERTOR_GROUPS
+    escape_literal = _escape_literal
+    append_regex = regex_parts.append
+    append_format = format_parts.append
 
-        path_regex += re.escape(path[idx : match.start()])
-        path_regex += f"(?P<{param_name}>{convertor.regex})"
+    idx = 0
+    start = path.find("<")
+    while start != -1:
+        end = path.find(">", start)
+        if end == -1:
+            break
+        match = PARAM_REGEX.fullmatch(path, start, end + 1)
+        if match is None:
+            # not a parameter, keep the "<" as a literal
+            start = path.find("<", start + 1)
+            continue
+        param_name, _, convertor_type = path[start + 1 : end].partition(":")
+        convertor_type = convertor_type or "str"
+        convertor_group = convertor_groups.get(convertor_type)
+        if convertor_group is None:
+            # not an assert, so that it still fails under python -O
+            raise ValueError(f"Unknown path convertor '{convertor_type}'")
+        convertor, group_tail = convertor_group
 
-        path_format += path[idx : match.start()]
-        path_format += "{%s}" % param_name
+        literal = path[idx:start]
+        append_regex(escape_literal(literal))
+        append_regex("(?P<")
+        append_regex(param_name)
+        append_regex(group_tail)
+        append_format(literal)
+        append_format("{%s}" % param_name)
 
         param_convertors[param_name] = convertor
 
-        idx = match.end()
+        idx = end + 1
+        start = path.find("<", idx)
 
-    path_regex += re.escape(path[idx:]) + "$"
-    path_format += path[idx:]
-    return re.compile(path_regex), path_format, param_convertors
+    literal = path[idx:]
+    regex_parts.append(_escape_literal(literal) + "$")
+    format_parts.append(literal)
+    path_regex = "".join(regex_parts)
+    path_format = "".join(format_parts)
+    return re.compile(path_regex), path_format, MappingProxyType(param_convertors)
 
 
 class ViewRoute(object):
+    __slots__ = (
+        "_view_func",
+        "_dependencies",
+        "dependant",
+        "_unique_id",
+        "body_field",
+        "body_mode",
+        "is_body_form",
+        "body_parser",
+        "_response_model",
+        "response_class",
+        "response_model_include",
+        "response_model_exclude",
+        "response_model_by_alias",
+        "response_field",
+        "status_code",
+        "tags",
+        "deprecated",
+        "include_in_schema",
+        "summary",
+        "description",
+        "response_description",
+        "name",
+        "operation_id",
+        "qualname",
+        "methods",
+        "path",
+        "path_regex",
+        "path_format",
+        "param_convertors",
+    )
+
     def __init__(
         self,
         view_func: ViewFunc,
@@ -85,34 +191,54 @@ class ViewRoute(object):
         operation_id: Optional[str] = None,
     ) -> None:
         self._view_func = view_func
+        self.qualname = view_func.__qualname__
         self._dependencies = dependencies or []
-        self._dependant = Dependant.new_dependant(call=view_func, is_view_func=True)
-        for depends in self._dependencies[::-1]:
-            self._dependant.dependencies.insert(
-                0,
-                self._dependant.new_paramless_sub_dependant(depends=depends),
-            )
-        self._unique_id = str(view_func)
-        self._body_field = self._dependant.get_body_field(name=self._unique_id)
-        self._is_body_form = bool(
-            self._body_field and isinstance(self._body_field.field_info, params.Form)
+        self.dependant = Dependant.new_dependant(call=view_func, is_view_func=True)
+        # route-level dependencies run before the ones declared on the view
+        self.dependant.dependencies[:0] = [
+            self.dependant.new_paramless_sub_dependant(depends=depends)
+            for depends in self._dependencies
+        ]
+        # stable across processes (no object address) and a valid identifier
+        self._unique_id = re.sub(
+            "[^0-9a-zA-Z_]", "_", f"{view_func.__module__}.{self.qualname}"
         )
+        self.body_field = self.dependant.get_body_field(name=self._unique_id)
+        # after get_body_field, which may mark the body params as embedded
+        self.dependant.freeze()
+        # 0: no body, 1: json body, 2: form body
+        if not self.body_field:
+            self.body_mode = BODY_MODE_NONE
+        elif isinstance(self.body_field.field_info, params.Form):
+            self.body_mode = BODY_MODE_FORM
+        else:
+            self.body_mode = BODY_MODE_JSON
+        self.is_body_form = self.body_mode == BODY_MODE_FORM
+        self.body_parser = BODY_PARSERS[self.body_mode]
         self._response_model = response_model
-        self._response_class = response_class or JsonResponse
+        self.response_class = response_class or JsonResponse
+        # frozen once, so the same objects are handed to BaseModel.dict()
+        # on every request
+        self.response_model_include: Optional[FrozenSet[str]] = (
+            frozenset(response_model_include) if response_model_include else None
+        )
+        self.response_model_exclude: Optional[FrozenSet[str]] = (
+            frozenset(response_model_exclude) if response_model_exclude else None
+        )
+        self.response_model_by_alias = response_model_by_alias
 
+        self.response_field: Optional[ModelField] = None
         if self._response_model:
             response_name = "Response_" + self._unique_id
-            self._response_field = DependantUtils.create_model_field(
-                name=response_name, type_=self._response_model
-            )
-            self._cloned_response_field = DependantUtils.create_cloned_field(
-                field=self._response_field,
+            # only the clone is used, the original field is dropped right away
+            self.response_field = DependantUtils.create_cloned_field(
+                field=DependantUtils.create_model_field(
+                    name=response_name, type_=self._response_model
+                ),
+                cloned_types=_CLONED_RESPONSE_TYPES,
             )
-        else:
-            self._response_field = None
-            self._cloned_response_field = None
 
-        self._status_code = status_code
+        self.status_code = status_code
 
         self.tags: List[str] = tags or []
         self.deprecated = deprecated
@@ -122,8 +248,7 @@ class ViewRoute(object):
         self.response_description = response_description
         self.name = name if name else get_view_name(view_func)
         self.operation_id = operation_id
-        self.qualname = self._view_func.__qualname__
-        self.methods = [self._view_func.__name__.upper()]
+        self.methods: Tuple[str, ...] = (self._view_func.__name__.upper(),)
         self.set_path(path="")
 
     def set_path(self, path: str) -> None:
@@ -131,27 +256,3 @@ class ViewRoute(object):
         self.path_regex, self.path_format, self.param_convertors = compile_path(
             self.path
         )
-
-    @property
-    def dependant(self) -> Dependant:
-        return self._dependant
-
-    @property
-    def is_body_form(self) -> bool:
-        return self._is_body_form
-
-    @property
-    def body_field(self) -> Optional[ModelField]:
-        return self._body_field
-
-    @property
-    def response_field(self) -> Optional[ModelField]:
-        return self._cloned_response_field
-
-    @property
-    def status_code(self) -> int:
-        return self._status_code
-
-    @property
-    def response_class(self) -> Optional[Type[HttpResponse]]:
-        return self._response_class
@@ -1,5 +1,6 @@
 import inspect
 import json
+from functools import lru_cache
 
 from django.http.request import HttpRequest
 from django.utils.datastructures import MultiValueDict
@@ -7,13 +8,27 @@ from django_autowired.typing import JSON
 from django_autowired.typing import ViewFunc
 
 
+_MISSING = object()
+
+
 def get_view_name(view_func: ViewFunc) -> str:
+    try:
+        return _get_cached_view_name(view_func)
+    except TypeError:
+        # unhashable callable
+        return _get_view_name(view_func)
+
+
+def _get_view_name(view_func: ViewFunc) -> str:
     if inspect.isfunction(view_func) or inspect.isclass(view_func):
         return view_func.__name__
 
     return view_func.__class__.__name__
 
 
+_get_cached_view_name = lru_cache(maxsize=1024)(_get_view_name)
+
+
 def get_body_form(request: HttpRequest):
     pass
 
@@ -27,18 +42,51 @@ def get_body_json(request: HttpRequest) -> JSON:
 
 
 class BodyConverter(object):
+    """
+    The parsed body is cached on the request, so that stacked autowired views
+    or middleware sharing the same request only parse it once.
+    """
+
+    FORM_CACHE_ATTR = "_autowired_form"
+    JSON_CACHE_ATTR = "_autowired_json"
+
     @classmethod
     def to_form(cls, request: HttpRequest) -> MultiValueDict:
-        data = MultiValueDict()
-        data.update(request.POST)
-        data.update(request.FILES)
+        data = getattr(request, cls.FORM_CACHE_ATTR, _MISSING)
+        if data is not _MISSING:
+            return data
+
+        post = request.POST
+        files = request.FILES
+        # the form data is only read, so when one side is empty the other is
+        # used as is instead of being copied
+        if not files:
+            data = post
+        elif not post:
+            data = files
+        else:
+            lists = dict(post.lists())
+            for key, value_list in files.lists():
+                lists[key] = lists[key] + value_list if key in lists else value_list
+            data = MultiValueDict(lists)
 
+        setattr(request, cls.FORM_CACHE_ATTR, data)
         return data
 
     @classmethod
     def to_json(cls, request: HttpRequest) -> JSON:
+        """
+        Parse the request body as JSON with the stdlib parser, which keeps
+        integers of any size exact and accepts NaN / Infinity.
+        """
+        body = getattr(request, cls.JSON_CACHE_ATTR, _MISSING)
+        if body is not _MISSING:
+            return body
+
         body_bytes = request.body
         body = None
         if body_bytes:
             body = json.loads(body_bytes)
+
+        setattr(request, cls.JSON_CACHE_ATTR, body)
         return body
@@ -1,4 +1,5 @@
 import json
+from functools import lru_cache
 from typing import Any
 from typing import Dict
 from typing import Optional
@@ -6,6 +7,36 @@ from urllib.parse import urlencode
 
 from django.test import TestCase
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+def dump_json(data: Any) -> bytes:
+    if orjson is not None:
+        # non str keys are stringified like json.dumps does
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data).encode()
+
+
+@lru_cache(maxsize=256)
+def _cached_urlencode(items: tuple) -> str:
+    return urlencode(items, doseq=True)
+
+
+def encode_query_params(query_params: Dict) -> str:
+    """urlencode(query_params, doseq=True), cached for repeated params"""
+    items = tuple(
+        (key, tuple(value) if isinstance(value, list) else value)
+        for key, value in query_params.items()
+    )
+    try:
+        return _cached_urlencode(items)
+    except TypeError:
+        # unhashable values
+        return urlencode(query_params, doseq=True)
+
 
 class BaseTestCase(TestCase):
     POST = "post"
@@ -23,10 +54,10 @@ class BaseTestCase(TestCase):
     ):
         extra = {}
         if query_params:
-            extra["QUERY_STRING"] = urlencode(query_params, doseq=True)
+            extra["QUERY_STRING"] = encode_query_params(query_params)
 
         if content_type == "application/json":
-            data = json.dumps(data)
+            data = dump_json(data)
             extra["content_type"] = content_type
 
         return self.client.post(url, data=data, **extra, **kwargs)
@@ -34,10 +65,10 @@ class BaseTestCase(TestCase):
     def put_json(self, url, data, query_params: Optional[Dict] = None, **kwargs):
         extra = {}
         if query_params:
-            extra["QUERY_STRING"] = urlencode(query_params, doseq=True)
+            extra["QUERY_STRING"] = encode_query_params(query_params)
         return self.client.put(
             url,
-            data=json.dumps(data),
+            data=dump_json(data),
             content_type="application/json",
             **extra,
             **kwargs
@@ -45,7 +76,7 @@ class BaseTestCase(TestCase):
 
     def delete_json(self, url, data, **kwargs):
         return self.client.delete(
-            url, data=json.dumps(data), content_type="application/json", **kwargs
+            url, data=dump_json(data), content_type="application/json", **kwargs
         )
 
     def get_json(self, url, data, **kwargs):
@@ -64,6 +95,5 @@ class BaseTestCase(TestCase):
             url, data, query_params=query_params, **kwargs
         )
         self.assertEqual(response.status_code, code)
-        content = response.content.decode()
-        data = json.loads(content)
-        return data
+        # json.loads accepts the raw bytes, no need to decode first
+        return json.loads(response.content)
@@ -1,3 +1,4 @@
+import json
 from copy import copy
 from typing import Optional
 
@@ -65,10 +66,17 @@ class MultiFieldBodyView(View):
         )
 
 
+class DefaultFieldBodyView(View):
+    @autowired(description="this is a default-field-body view")
+    def post(self, item: Item, count: int = Body(5), tag: str = Body("x")):
+        return JsonResponse(data={"count": count, "tag": tag})
+
+
 urlpatterns = [
     path(route="class-body/<int:id>/", view=ClassBodyView.as_view()),
     path(route="embed-body/", view=EmbedBodyView.as_view()),
     path(route="multi-field-body/", view=MultiFieldBodyView.as_view()),
+    path(route="default-field-body/", view=DefaultFieldBodyView.as_view()),
 ]
 
 
@@ -188,6 +196,22 @@ class TestEmbedBodyView(BaseTestCase):
 
         self.assertEqual(data, case["item"])
 
+    def test_invalid_json(self):
+        response = self.client.post(
+            "/embed-body/", data='{"item": ', content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_big_int(self):
+        # sent as raw text, integers beyond 64 bits must keep their exact value
+        response = self.client.post(
+            "/embed-body/",
+            data='{"item": {"id": 12345678901234567890123, "name": "n", "price": 1}}',
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)["id"], 12345678901234567890123)
+
 
 @override_settings(ROOT_URLCONF="tests.test_body")
 class TestMultiFieldBody(BaseTestCase):
@@ -218,3 +242,28 @@ class TestMultiFieldBody(BaseTestCase):
         )
 
         self.assertEqual(data, case)
+
+
+@override_settings(ROOT_URLCONF="tests.test_body")
+class TestDefaultFieldBody(BaseTestCase):
+    item = {"id": 111, "name": "item_name", "price": 2.3}
+
+    def test_default(self):
+        data = self.method_json_expect_code(
+            method=self.POST,
+            code=200,
+            url="/default-field-body/",
+            data={"item": self.item},
+        )
+
+        self.assertEqual(data, {"count": 5, "tag": "x"})
+
+    def test_falsy_value(self):
+        data = self.method_json_expect_code(
+            method=self.POST,
+            code=200,
+            url="/default-field-body/",
+            data={"item": self.item, "count": 0, "tag": ""},
+        )
+
+        self.assertEqual(data, {"count": 0, "tag": ""})
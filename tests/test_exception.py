@@ -0,0 +1,91 @@
+from enum import Enum
+
+from django.http.request import HttpRequest
+from django.http.response import JsonResponse
+from django.test import override_settings
+from django.urls import path
+from django.views import View
+from django_autowired.autowired import autowired
+from django_autowired.exceptions import APIException
+from tests.base import BaseTestCase
+
+
+class ForbiddenView(View):
+    @autowired(description="this is forbidden view")
+    def get(self, request: HttpRequest, reason: str = None):
+        raise APIException(status_code=403, detail=reason)
+
+
+class ConflictException(APIException):
+    pass
+
+
+@autowired(description="this is func-conflict view")
+def func_conflict_view(request: HttpRequest):
+    raise ConflictException(status_code=409, detail=["name", "taken"])
+
+
+class Color(Enum):
+    red = "red"
+    blue = "blue"
+
+
+@autowired(description="this is func-color view")
+def func_color_view(request: HttpRequest, color: Color, limit: int):
+    return JsonResponse(data={"color": color.value, "limit": limit})
+
+
+@autowired(description="this is func-big-int view")
+def func_big_int_view(request: HttpRequest):
+    raise APIException(status_code=409, detail={"id": 12345678901234567890123})
+
+
+urlpatterns = [
+    path(route="forbidden/", view=ForbiddenView.as_view()),
+    path(route="func-conflict/", view=func_conflict_view),
+    path(route="func-color/", view=func_color_view),
+    path(route="func-big-int/", view=func_big_int_view),
+]
+
+
+@override_settings(ROOT_URLCONF="tests.test_exception")
+class TestAPIException(BaseTestCase):
+    def test_default_detail(self):
+        data = self.method_json_expect_code(
+            method=self.GET, code=403, url="/forbidden/", data={}
+        )
+        self.assertEqual(data, {"detail": "Forbidden"})
+
+    def test_detail(self):
+        for _ in range(2):
+            data = self.method_json_expect_code(
+                method=self.GET, code=403, url="/forbidden/", data={"reason": "no"}
+            )
+            self.assertEqual(data, {"detail": "no"})
+
+    def test_subclass_unhashable_detail(self):
+        data = self.method_json_expect_code(
+            method=self.GET, code=409, url="/func-conflict/", data={}
+        )
+        self.assertEqual(data, {"detail": ["name", "taken"]})
+
+    def test_big_int_detail(self):
+        data = self.method_json_expect_code(
+            method=self.GET, code=409, url="/func-big-int/", data={}
+        )
+        self.assertEqual(data, {"detail": {"id": 12345678901234567890123}})
+
+
+@override_settings(ROOT_URLCONF="tests.test_exception")
+class TestRequestValidationError(BaseTestCase):
+    def test_errors_detail(self):
+        data = self.method_json_expect_code(
+            method=self.GET, code=400, url="/func-color/", data={"color": "green"}
+        )
+        errors = {tuple(error["loc"]): error for error in data["detail"]}
+        self.assertEqual(set(errors), {("query", "color"), ("query", "limit")})
+        self.assertEqual(errors[("query", "color")]["type"], "type_error.enum")
+        self.assertEqual(
+            errors[("query", "color")]["ctx"], {"enum_values": ["red", "blue"]}
+        )
+        self.assertEqual(errors[("query", "limit")]["type"], "value_error.missing")
@@ -1,5 +1,6 @@
 import json
-import os
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict
 
 from django.http.request import HttpRequest
@@ -8,6 +9,7 @@ from django.test import override_settings
 from django.urls import path
 from django.views import View
 from django_autowired.autowired import autowired
+from django_autowired.openapi.utils import jsonable_encoder
 from django_autowired.openapi.utils import OpenAPISchemaGenerator
 from django_autowired.param_func import Body
 from pydantic import BaseModel
@@ -36,6 +38,15 @@ urlpatterns = [
 ]
 
 
+SAMPLE_JSON_PATH = Path(__file__).parent / "openapi_json" / "sample.json"
+
+
+@lru_cache(maxsize=1)
+def load_sample_json() -> Dict:
+    with SAMPLE_JSON_PATH.open("rb") as f:
+        return json.load(f)
+
+
 @override_settings(ROOT_URLCONF="tests.test_body")
 class TestOpenapiSchema(BaseTestCase):
     # def test_open_api(self):
@@ -50,10 +61,29 @@ class TestOpenapiSchema(BaseTestCase):
             view_route=autowired.view_route,
         )
         res = generator.get_schema()
-        file_path = os.path.join(os.getcwd(), "tests/openapi_json/sample.json")
-        with open(file_path, "r") as f:
-            openapi_schema = json.load(f)
-        assert res == openapi_schema
+        assert res == load_sample_json()
+
+
+class TestPathFromRegex(BaseTestCase):
+    def test_get_path_from_regex(self):
+        cases = {
+            r"^(?P<a>\w+)/b/(?P<c>\w+)/$": "/{a}/b/{c}/",
+            r"^(?P<a>(x|y))/b/$": "/{a}/b/",
+            r"^b/((x|y)\w+)/(\d+)/c\.json$": "/b/{var}/{var}/c.json",
+            "items/<int:pk>/": "/items/{pk}/",
+        }
+        for regex, expected in cases.items():
+            self.assertEqual(
+                OpenAPISchemaGenerator.get_path_from_regex(regex), expected
+            )
+
+
+class TestJsonableEncoder(BaseTestCase):
+    def test_custom_encoder_does_not_leak(self):
+        items = Items(items={"a": 1})
+        data = jsonable_encoder(items, custom_encoder={int: str})
+        self.assertEqual(data, {"items": {"a": 1}})
+        self.assertEqual(Items.__config__.json_encoders, {})
 
 
 # @override_settings(ROOT_URLCONF="tests.test_body")
@@ -5,6 +5,7 @@ from django.urls import path
 from django.views import View
 from django_autowired.autowired import autowired
 from django_autowired.param_func import Path
+from django_autowired.route import compile_path
 from tests.base import BaseTestCase
 
 
@@ -68,3 +69,17 @@ class TestFuncPathView(BaseTestCase):
         self.method_json_expect_code(
             method=self.GET, code=400, url="/func-path/33/bean", data={}
         )
+
+
+class TestCompilePath(BaseTestCase):
+    def test_compile(self):
+        regex, path_format, convertors = compile_path("/a-b/<id:int>/<name>")
+        assert regex.pattern == "^/a\\-b/(?P<id>[0-9]+)/(?P<name>[^/]+)$"
+        assert path_format == "/a-b/{id}/{name}"
+        assert list(convertors) == ["id", "name"]
+        # invalid placeholders are kept as literals
+        assert compile_path("/<1a>")[1] == "/<1a>"
+
+    def test_unknown_convertor(self):
+        with self.assertRaises(ValueError):
+            compile_path("/<id:nope>")
@@ -39,6 +39,12 @@ class MultiValueQueryView(View):
         return JsonResponse(data={"q": q})
 
 
+class ForwardRefQueryView(View):
+    @autowired(description="this is forward-ref-query view")
+    def get(self, request: HttpRequest, limit: "int", q: "Optional[str]" = None):
+        return JsonResponse(data={"limit": limit, "q": q})
+
+
 @autowired(description="this is func-query view")
 def func_query_view(
     request: HttpRequest,
@@ -55,6 +61,7 @@ urlpatterns = [
     path(route="func-query/<int:id>/", view=func_query_view),
     path(route="alias-query/", view=AliasQueryView.as_view()),
     path(route="multi-value-query/", view=MultiValueQueryView.as_view()),
+    path(route="forward-ref-query/", view=ForwardRefQueryView.as_view()),
 ]
 
 
@@ -190,3 +197,23 @@ class TestMultiValueQueryView(BaseTestCase):
             data={},
         )
         self.assertListEqual(["one", "two"], data["q"])
+
+
+@override_settings(ROOT_URLCONF="tests.test_query")
+class TestForwardRefQueryView(BaseTestCase):
+    def test_success(self):
+        data = self.method_json_expect_code(
+            method=self.GET,
+            code=200,
+            url="/forward-ref-query/",
+            data={"limit": "3"},
+        )
+        self.assertDictEqual({"limit": 3, "q": None}, data)
+
+    def test_validate_error(self):
+        self.method_json_expect_code(
+            method=self.GET,
+            code=400,
+            url="/forward-ref-query/",
+            data={"limit": "three"},
+        )
@@ -43,9 +43,45 @@ class OutputView(View):
         return user
 
 
+class Friends(BaseModel):
+    user: UserOut
+    friends: List[UserOut]
+
+
+class NestedOutputView(View):
+    @autowired("this is nested-output-view", response_model=Friends)
+    def post(self, request: HttpRequest, user: UserIn):
+        return {"user": user, "friends": [user, user]}
+
+
+class ExcludeOutputView(View):
+    @autowired(
+        "this is exclude-output-view",
+        response_model=UserOut,
+        response_model_exclude={"full_name"},
+    )
+    def post(self, request: HttpRequest, user: UserIn):
+        return user
+
+
+class PlainView(View):
+    @autowired("this is plain-view")
+    def get(self, request: HttpRequest):
+        return {"method": request.method}
+
+
+@autowired("this is func-plain-view")
+def func_plain_view(request: HttpRequest):
+    return {"method": request.method}
+
+
 urlpatterns = [
     path(route="create/", view=CreateView.as_view()),
     path(route="output/", view=OutputView.as_view()),
+    path(route="nested-output/", view=NestedOutputView.as_view()),
+    path(route="exclude-output/", view=ExcludeOutputView.as_view()),
+    path(route="plain/", view=PlainView.as_view()),
+    path(route="func-plain/", view=func_plain_view),
 ]
 
 
@@ -89,3 +125,51 @@ class TestOutputView(BaseTestCase):
                 "full_name": "full",
             },
         )
+
+
+@override_settings(ROOT_URLCONF="tests.test_response_model")
+class TestNestedOutputView(BaseTestCase):
+    def test_success1(self):
+        case = {
+            "username": "item_name",
+            "password": "2.3",
+            "email": "a@gmail.com",
+        }
+        data = self.method_json_expect_code(
+            method=self.POST,
+            code=200,
+            url="/nested-output/",
+            data=case,
+        )
+
+        user = {"username": "item_name", "email": "a@gmail.com", "full_name": None}
+        self.assertDictEqual(data, {"user": user, "friends": [user, user]})
+
+
+@override_settings(ROOT_URLCONF="tests.test_response_model")
+class TestExcludeOutputView(BaseTestCase):
+    def test_success1(self):
+        case = {
+            "username": "item_name",
+            "password": "2.3",
+            "email": "a@gmail.com",
+            "full_name": "full",
+        }
+        data = self.method_json_expect_code(
+            method=self.POST,
+            code=200,
+            url="/exclude-output/",
+            data=case,
+        )
+
+        self.assertDictEqual(data, {"username": "item_name", "email": "a@gmail.com"})
+
+
+@override_settings(ROOT_URLCONF="tests.test_response_model")
+class TestPlainView(BaseTestCase):
+    def test_success(self):
+        for url in ("/plain/", "/func-plain/"):
+            data = self.method_json_expect_code(
+                method=self.GET, code=200, url=url, data={}
+            )
+            self.assertDictEqual(data, {"method": "GET"})